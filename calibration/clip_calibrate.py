@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import json
-import math
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
@@ -38,16 +37,22 @@ class ClipCalibrator:
         self,
         config_path: Optional[Path] = None,
         artifact_root: Optional[Path] = None,
+        config: Optional[Mapping[str, Any]] = None,
     ) -> None:
+        """Load the calibration config, or use ``config`` if already parsed."""
+
         base_dir = Path(__file__).resolve().parent
         if config_path is None:
             config_path = base_dir.parent / "config" / "calibration.yaml"
         self.config_path = Path(config_path)
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Calibration config not found: {self.config_path}")
+        if config is not None:
+            self.config: Dict[str, Any] = dict(config)
+        else:
+            if not self.config_path.exists():
+                raise FileNotFoundError(f"Calibration config not found: {self.config_path}")
 
-        with self.config_path.open("r", encoding="utf-8") as fh:
-            self.config: Dict[str, Any] = yaml.safe_load(fh) or {}
+            with self.config_path.open("r", encoding="utf-8") as fh:
+                self.config = yaml.safe_load(fh) or {}
 
         if "targets" not in self.config:
             raise KeyError("Calibration config must define 'targets'.")
@@ -154,20 +159,23 @@ class ClipCalibrator:
         predictions = probs.argmax(axis=1)
         correctness = (predictions == labels).astype(np.float64)
 
-        bin_boundaries = np.linspace(0.0, 1.0, bins + 1)
-        ece = 0.0
         total = len(confidences)
-        for lower, upper in zip(bin_boundaries[:-1], bin_boundaries[1:]):
-            in_bin = (confidences >= lower) & (confidences < upper)
-            if math.isclose(upper, 1.0):
-                in_bin |= confidences == 1.0
-            count = int(np.sum(in_bin))
-            if count == 0:
-                continue
-            acc = float(np.mean(correctness[in_bin]))
-            conf = float(np.mean(confidences[in_bin]))
-            ece += (count / total) * abs(acc - conf)
-        return float(ece)
+        if total == 0:
+            return 0.0
+
+        # Bins are half-open [lower, upper) except the last, which also takes
+        # confidences of exactly 1.0.
+        bin_boundaries = np.linspace(0.0, 1.0, bins + 1)
+        bin_ids = np.searchsorted(bin_boundaries, confidences, side="right") - 1
+        bin_ids[confidences == 1.0] = bins - 1
+        in_range = (bin_ids >= 0) & (bin_ids < bins)
+        bin_ids = bin_ids[in_range]
+
+        # Summing |sum(correct) - sum(conf)| per bin equals weighting each
+        # bin's |accuracy - confidence| gap by its share of the samples.
+        acc_sums = np.bincount(bin_ids, weights=correctness[in_range], minlength=bins)
+        conf_sums = np.bincount(bin_ids, weights=confidences[in_range], minlength=bins)
+        return float(np.sum(np.abs(acc_sums - conf_sums)) / total)
 
     @staticmethod
     def softmax(logits: np.ndarray) -> np.ndarray:
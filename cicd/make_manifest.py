@@ -26,17 +26,22 @@ def _iter_files(directory: Path) -> Iterable[Path]:
             yield path
 
 
-def _file_entry(path: Path, base_dir: Path) -> Dict[str, object]:
-    sha256 = hashlib.sha256()
+def _sha256(path: Path) -> str:
     with path.open("rb") as handle:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hash through the C-level readinto loop.
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+
+        sha256 = hashlib.sha256()
         for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            if not chunk:
-                break
             sha256.update(chunk)
+        return sha256.hexdigest()
 
+
+def _file_entry(path: Path, base_dir: Path) -> Dict[str, object]:
     return {
         "path": str(path.relative_to(base_dir)),
-        "sha256": sha256.hexdigest(),
+        "sha256": _sha256(path),
         "size": path.stat().st_size,
     }
 
@@ -21,8 +21,10 @@ class RollingStats:
     def add(self, duration: float) -> None:
         self.count += 1
         self.total += duration
-        self.minimum = min(self.minimum, duration)
-        self.maximum = max(self.maximum, duration)
+        if duration < self.minimum:
+            self.minimum = duration
+        if duration > self.maximum:
+            self.maximum = duration
 
     def snapshot(self) -> Dict[str, float]:
         if self.count == 0:
@@ -72,10 +74,16 @@ class MetricsRegistry:
 
     def _add_duration(self, tag: str, duration: float) -> None:
         with self._lock:
-            stage_stats = self._latencies.setdefault(tag, RollingStats())
-            stage_stats.add(duration)
-            aggregate = self._latencies.setdefault("all", RollingStats())
-            aggregate.add(duration)
+            self._stats_for(tag).add(duration)
+            self._stats_for("all").add(duration)
+
+    def _stats_for(self, tag: str) -> RollingStats:
+        # ``dict.setdefault`` would build a throwaway RollingStats on every
+        # recorded event; only allocate the first time a tag is seen.
+        stats = self._latencies.get(tag)
+        if stats is None:
+            stats = self._latencies[tag] = RollingStats()
+        return stats
 
     def increment_sessions(self) -> None:
         with self._lock:
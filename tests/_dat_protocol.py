@@ -0,0 +1,34 @@
+"""Load the DAT wire protocol module without importing ``src/__init__.py``."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_dat_protocol() -> types.ModuleType:
+    """Return ``src/wire/dat_protocol.py``, loading it without ``src/__init__.py``.
+
+    Only the wire-protocol tests call this, so the rest of the suite never
+    pays for importing pydantic.
+    """
+
+    module = sys.modules.get("dat_protocol")
+    if module is not None:
+        return module
+
+    protocol_path = ROOT / "src" / "wire" / "dat_protocol.py"
+    spec = importlib.util.spec_from_file_location("dat_protocol", protocol_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["dat_protocol"] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules["dat_protocol"]
+        raise
+    return module
@@ -0,0 +1,89 @@
+"""Deterministic fake timer shared by the handshake and duty-cycle tests."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Callable, List, Tuple
+
+
+class FakeTimerHandle:
+    def __init__(
+        self, callback: Callable[[], None], deadline: float, timer: "FakeTimer | None" = None
+    ) -> None:
+        self._callback = callback
+        self.deadline = deadline
+        self.cancelled = False
+        # Set while the handle sits in the timer's queue.
+        self._timer = timer
+
+    def cancel(self) -> None:
+        if self.cancelled:
+            return
+        self.cancelled = True
+        if self._timer is not None:
+            self._timer._note_cancelled()
+
+    def fire(self) -> None:
+        if not self.cancelled:
+            self._callback()
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self._now = 0.0
+        # ``(deadline, seq, handle)`` entries order on the deadline, with the
+        # counter breaking ties in scheduling order, so the heap never
+        # compares handles.
+        self._queue: List[Tuple[float, int, FakeTimerHandle]] = []
+        self._seq = itertools.count()
+        self._cancelled_count = 0
+
+    def now(self) -> float:
+        return self._now
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> FakeTimerHandle:
+        handle = FakeTimerHandle(callback, self._now + delay, self)
+        heapq.heappush(self._queue, (handle.deadline, next(self._seq), handle))
+        return handle
+
+    def _note_cancelled(self) -> None:
+        # Cancelled handles are skipped lazily when popped; once they make up
+        # more than half the queue (heartbeats cancel and re-arm the degrade
+        # timer), drop them so the heap only holds live timers.
+        self._cancelled_count += 1
+        if self._cancelled_count > len(self._queue) // 2:
+            self._queue = [entry for entry in self._queue if not entry[2].cancelled]
+            heapq.heapify(self._queue)
+            self._cancelled_count = 0
+
+    def _pop_due(self) -> List[Tuple[float, int, FakeTimerHandle]]:
+        """Remove and return every due entry, in firing order."""
+
+        due: List[Tuple[float, int, FakeTimerHandle]] = []
+        while self._queue and self._queue[0][0] <= self._now:
+            due.append(heapq.heappop(self._queue))
+            if len(due) > 8:
+                # A burst of due timers: split the rest of the queue in one
+                # pass and re-heapify the remainder instead of sifting the
+                # heap for every further pop.
+                due.extend(entry for entry in self._queue if entry[0] <= self._now)
+                self._queue = [entry for entry in self._queue if entry[0] > self._now]
+                heapq.heapify(self._queue)
+                due.sort()
+                break
+        return due
+
+    def advance(self, delta: float) -> None:
+        self._now += delta
+        # Callbacks may schedule timers that are already due; keep draining
+        # until none are left, as a pop-one-fire-one loop would.
+        while due := self._pop_due():
+            # Detach the whole batch first so a callback cancelling a later
+            # handle in it is not counted against the queue.
+            for _, _, handle in due:
+                handle._timer = None
+                if handle.cancelled:
+                    self._cancelled_count -= 1
+            for _, _, handle in due:
+                handle.fire()
@@ -0,0 +1,12 @@
+"""Handshake budgets shared by the handshake and duty-cycle tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from fsm import HandshakeBudgets, load_handshake_budgets
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# HandshakeBudgets is frozen, so every FSM in these tests can share one instance.
+BUDGETS: HandshakeBudgets = load_handshake_budgets(ROOT / "config" / "ux_budgets.yaml")
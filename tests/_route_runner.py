@@ -0,0 +1,30 @@
+"""Load ``src/vision/route_runner.py`` without importing the vision package."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_route_runner() -> types.ModuleType:
+    """Return ``src/vision/route_runner.py`` as ``vision.route_runner``, loading it once."""
+
+    module = sys.modules.get("vision.route_runner")
+    if module is not None:
+        return module
+
+    runner_path = ROOT / "src" / "vision" / "route_runner.py"
+    spec = importlib.util.spec_from_file_location("vision.route_runner", runner_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["vision.route_runner"] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules["vision.route_runner"]
+        raise
+    return module
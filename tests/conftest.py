@@ -7,6 +7,8 @@ import sys
 import types
 from pathlib import Path
 
+import pytest
+
 
 def _ensure_project_on_path() -> None:
     root = Path(__file__).resolve().parents[1]
@@ -37,3 +39,74 @@ def _ensure_perception_vad() -> None:
 _ensure_project_on_path()
 _ensure_perception_vad()
 
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow (nightly lane)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    # CI distributes with ``--dist=loadgroup``. Keep each file on one worker by
+    # default, as many modules share module-level state between tests; files
+    # marked ``xdist_spread`` set up all state per test and may fan out.
+    for item in items:
+        if item.get_closest_marker("xdist_spread") or item.get_closest_marker("xdist_group"):
+            continue
+        item.add_marker(pytest.mark.xdist_group(item.nodeid.split("::", 1)[0]))
+
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test; pass --run-slow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def fsm_spec():
+    """States and events of the caption/confirm machine used by the FSM tests.
+
+    ``State`` and ``Event`` are frozen dataclasses, so every router built from
+    this spec can share the same instances.
+    """
+
+    src_root = str(Path(__file__).resolve().parents[1] / "src")
+    if src_root not in sys.path:
+        sys.path.insert(0, src_root)
+    from policy.fsm import Event, State
+
+    states = (
+        State("IDLE"),
+        State("PERCEIVE"),
+        State("FUSE"),
+        State("CAPTION"),
+        State("SPEAK", irreversible=True),
+        State("CONFIRM"),
+    )
+    events = (
+        Event("WAKE", "IDLE", "PERCEIVE"),
+        Event("FRAME", "PERCEIVE", "FUSE"),
+        Event("FUSED", "FUSE", "CAPTION"),
+        Event("CAPTION_READY", "CAPTION", "CONFIRM"),
+        Event("CONFIRM_YES", "CONFIRM", "SPEAK"),
+        Event("CONFIRM_NO", "CONFIRM", "CAPTION"),
+        Event("CANCEL", ("PERCEIVE", "FUSE", "CAPTION", "CONFIRM", "SPEAK"), "IDLE"),
+        Event("TIMEOUT", "CONFIRM", "IDLE"),
+        Event("SPEAK_DONE", "SPEAK", "IDLE"),
+    )
+    return states, events
+
+
+@pytest.fixture(name="router")
+def fixture_router(fsm_spec):
+    """Return a fresh router in ``IDLE``; hooks and counts are per instance."""
+
+    from policy.fsm import FSMRouter
+
+    states, events = fsm_spec
+    return FSMRouter(states, events, initial_state="IDLE")
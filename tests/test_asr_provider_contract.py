@@ -6,6 +6,8 @@ from pathlib import Path
 import sys
 from types import SimpleNamespace
 
+import numpy as np
+
 project_src = Path(__file__).resolve().parents[1] / "src"
 if str(project_src) not in sys.path:
     sys.path.append(str(project_src))
@@ -19,7 +21,10 @@ def test_run_with_provider_matches_manual_frames() -> None:
     manual_provider = MockProvider()
     manual_mic = manual_provider.open_audio_stream()
     assert manual_mic is not None
-    manual_frames = list(frames_from_mic(manual_mic, seconds=1.0))
+    # One second at 16 kHz splits evenly into 20 ms windows, so the frames can
+    # be packed into a single contiguous (frames, samples) buffer; iterating it
+    # replays each window as a row view.
+    manual_frames = np.stack(list(frames_from_mic(manual_mic, seconds=1.0)))
 
     manual_stream = ASRStream(
         stability_delta=0.1,
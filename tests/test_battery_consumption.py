@@ -4,10 +4,21 @@ import time
 import sys
 import subprocess
 from datetime import datetime
+from pathlib import Path
+
+# When running on the phone itself (e.g. Termux), the kernel exposes the
+# battery level directly, so there is no need to fork an adb shell.
+SYSFS_BATTERY_CAPACITY = Path("/sys/class/power_supply/battery/capacity")
+HAS_SYSFS_BATTERY = SYSFS_BATTERY_CAPACITY.exists()
 
 def get_battery_level(device="phone"):
     """Get battery level for glasses or phone."""
     if device == "phone":
+        if HAS_SYSFS_BATTERY:
+            try:
+                return int(SYSFS_BATTERY_CAPACITY.read_text().strip())
+            except (OSError, ValueError) as e:
+                print(f"WARNING: reading {SYSFS_BATTERY_CAPACITY} failed ({e}), falling back to adb")
         try:
             result = subprocess.run(
                 ["adb", "shell", "dumpsys", "battery"],
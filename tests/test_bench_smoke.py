@@ -15,6 +15,8 @@ BENCH_SCRIPT = ROOT / "bench" / "latency_bench.py"
 def test_latency_bench_smoke(tmp_path):
     output_csv = tmp_path / "latency.csv"
 
+    # The benchmark's console output is never inspected, so discard it instead
+    # of buffering it in memory.
     completed = subprocess.run(
         [
             sys.executable,
@@ -27,18 +29,21 @@ def test_latency_bench_smoke(tmp_path):
             str(output_csv),
         ],
         check=True,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
     )
 
     assert completed.returncode == 0
     assert output_csv.exists(), "Latency benchmark did not produce an output file"
 
+    # Only the header and the first sample are checked, so stream them rather
+    # than materialising every row.
     with output_csv.open(newline="") as fp:
-        rows = list(csv.reader(fp))
+        reader = csv.reader(fp)
+        header = next(reader, None)
+        first_sample = next(reader, None)
 
-    assert rows, "Latency benchmark output CSV is empty"
-    assert rows[0] == ["task", "ms"], "Unexpected CSV header from latency benchmark"
-    assert len(rows) >= 2, "Latency benchmark should record at least one sample"
+    assert header is not None, "Latency benchmark output CSV is empty"
+    assert header == ["task", "ms"], "Unexpected CSV header from latency benchmark"
+    assert first_sample is not None, "Latency benchmark should record at least one sample"
     # Ensure the latency value can be parsed as a float.
-    float(rows[1][1])
+    float(first_sample[1])
@@ -1,5 +1,8 @@
+from unittest import mock
+
 import numpy as np
 
+from drivers import AudioOut, DisplayOverlay
 from src.perception.ocr import MockOCR
 from src.perception.vision_keyframe import VQEncoder, select_keyframes
 from src.skills.caption import MockCaptioner, caption_from_frames, caption_from_provider
@@ -16,38 +19,18 @@ def _moving_square(num_frames: int = 12, size: int = 6) -> np.ndarray:
     return np.stack(frames, axis=0)
 
 
-class _Audio:
-    def __init__(self) -> None:
-        self.spoken: list[str] = []
-
-    def speak(self, text: str) -> dict:
-        self.spoken.append(text)
-        return {"text": text}
-
-
-class _Display:
-    def __init__(self) -> None:
-        self.rendered: dict | None = None
-
-    def render(self, payload: dict) -> dict:
-        self.rendered = payload
-        return payload
-
-
-class _Provider:
-    def __init__(self, frames: np.ndarray, *, show_overlay: bool) -> None:
-        self._frames = frames
-        self.audio = _Audio()
-        self.display = _Display()
-        self._show_overlay = show_overlay
-
-    def camera(self, *, seconds: int = 1):
-        del seconds
-        for frame in self._frames:
-            yield frame
-
-    def has_display(self) -> bool:
-        return self._show_overlay
+def _provider(frames: np.ndarray, *, show_overlay: bool) -> mock.Mock:
+    audio = mock.Mock(spec=AudioOut)
+    audio.speak.side_effect = lambda text: {"text": text}
+    display = mock.Mock(spec=DisplayOverlay)
+    display.render.side_effect = lambda payload: payload
+    return mock.Mock(
+        spec=["audio", "display", "camera", "has_display"],
+        audio=audio,
+        display=display,
+        camera=lambda *, seconds=1: iter(frames),
+        has_display=lambda: show_overlay,
+    )
 
 
 def test_caption_from_frames_reports_motion_and_signature():
@@ -75,7 +58,7 @@ def test_mock_captioner_matches_helper():
 
 def test_caption_from_provider_produces_caption_and_audio():
     frames = _moving_square()
-    provider = _Provider(frames, show_overlay=False)
+    provider = _provider(frames, show_overlay=False)
 
     mock_ocr = MockOCR()
     mock_ocr.intensity_threshold = 0
@@ -83,5 +66,5 @@ def test_caption_from_provider_produces_caption_and_audio():
 
     assert payload["type"] == "caption"
     assert payload["text"].strip()
-    assert provider.audio.spoken == [payload["text"]]
-    assert provider.display.rendered is None
+    assert provider.audio.speak.call_args_list == [mock.call(payload["text"])]
+    provider.display.render.assert_not_called()
@@ -5,14 +5,39 @@ from __future__ import annotations
 import importlib
 import os
 import sys
+from types import ModuleType
 
 
-def _reload_src_package() -> None:
-    """Remove ``src`` modules from ``sys.modules`` so they import fresh."""
+def _reload_src_package() -> dict[str, ModuleType]:
+    """Remove ``src`` modules from ``sys.modules`` so they import fresh.
+
+    The removed submodules are returned so callers can restore them once the
+    top-level ``src/__init__.py`` side effects have been exercised, keeping
+    them warm for the rest of the session. The package itself is not
+    returned: the freshly imported one replaces any stub installed earlier.
+    """
 
     to_clear = [name for name in sys.modules if name == "src" or name.startswith("src.")]
-    for name in to_clear:
-        sys.modules.pop(name, None)
+    removed = {name: sys.modules.pop(name) for name in to_clear}
+    removed.pop("src", None)
+    return removed
+
+
+def _restore_src_submodules(saved: dict[str, ModuleType]) -> None:
+    """Put back the submodules the fresh ``src`` import did not load again.
+
+    Each restored submodule is also bound on its parent package, as an import
+    would, so dotted lookups such as ``src.utils`` keep working.
+    """
+
+    for name in sorted(saved, key=lambda name: name.count(".")):
+        if name in sys.modules:
+            continue
+        sys.modules[name] = saved[name]
+        parent_name, _, child = name.rpartition(".")
+        parent = sys.modules.get(parent_name)
+        if parent is not None:
+            setattr(parent, child, saved[name])
 
 
 def test_ci_env_forces_mock_provider(monkeypatch) -> None:
@@ -20,8 +45,11 @@ def test_ci_env_forces_mock_provider(monkeypatch) -> None:
     monkeypatch.setenv("PROVIDER", "meta")
     monkeypatch.setenv("USE_WHISPER_STREAMING", "1")
 
-    _reload_src_package()
-    importlib.import_module("src")
+    saved = _reload_src_package()
+    try:
+        importlib.import_module("src")
+    finally:
+        _restore_src_submodules(saved)
 
     assert os.getenv("PROVIDER") == "mock"
     assert "USE_WHISPER_STREAMING" not in os.environ
@@ -32,8 +60,11 @@ def test_non_ci_env_preserves_configuration(monkeypatch) -> None:
     monkeypatch.setenv("PROVIDER", "meta")
     monkeypatch.setenv("USE_WHISPER_STREAMING", "1")
 
-    _reload_src_package()
-    importlib.import_module("src")
+    saved = _reload_src_package()
+    try:
+        importlib.import_module("src")
+    finally:
+        _restore_src_submodules(saved)
 
     assert os.getenv("PROVIDER") == "meta"
     assert os.getenv("USE_WHISPER_STREAMING") == "1"
@@ -11,6 +11,8 @@ The tests cover:
 - Actions list structure and content validation
 
 These tests run entirely offline and are suitable for CI/CD pipelines.
+The classes share the module-level server module cache, so the file runs
+on a single worker under ``pytest -n auto --dist=loadgroup``.
 
 For manual smoke tests with real Ray-Ban Meta glasses, see:
     docs/meta_dat_implementation_plan.md - Section on "Testing with Real Hardware"
@@ -28,14 +30,21 @@ Note: Hardware tests are not run in CI and require physical devices.
 # Ensure pytest plugins are loaded before other imports
 pytest_plugins = ["tests.test_edge_runtime_server"]
 
-import base64
+import asyncio
+import binascii
+import importlib.util
 import io
+import json
+import os
+import platform
 import sys
 import types
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from uuid import uuid4, UUID
+from uuid import UUID
 
+import httpx
 import numpy as np
 import pytest
 import soundfile as sf
@@ -49,80 +58,182 @@ from tests.test_edge_runtime_server import (
 )
 
 
+@lru_cache(maxsize=8)
 def _encode_pcm_s16le(duration_seconds: float = 0.1, sample_rate: int = 16000) -> str:
-    """Generate base64-encoded PCM s16le audio for DAT streaming."""
-    samples = int(duration_seconds * sample_rate)
-    # Create simple sine wave for more realistic audio
-    t = np.linspace(0, duration_seconds, samples)
-    audio_float = 0.1 * np.sin(2 * np.pi * 440 * t)  # 440 Hz tone at low volume
-    # Convert to int16
-    audio_int16 = (audio_float * 32767).astype(np.int16)
-    return base64.b64encode(audio_int16.tobytes()).decode()
-
-
-@pytest.fixture(name="dat_app")
-def fixture_dat_app(monkeypatch):
-    """Create FastAPI app configured for DAT testing with mock provider."""
-    # Use the same pattern as test_edge_runtime_server.py
+    """Generate base64-encoded PCM s16le audio for DAT streaming.
+
+    The server only buffers the samples, so silence is as good as a tone;
+    it is built directly as int16. The payload depends only on the
+    arguments and is cached per ``(duration_seconds, sample_rate)``.
+    """
+    audio_int16 = np.zeros(int(duration_seconds * sample_rate), dtype=np.int16)
+    # Encode straight from the array's buffer; tobytes() would copy it first.
+    return binascii.b2a_base64(memoryview(audio_int16).cast("B"), newline=False).decode("ascii")
+
+
+# Request bodies shared by the tests below. Tests never mutate these; they
+# merge per-test fields on top with ``{**template, ...}``.
+_BASE_INIT = {"device_id": "test-device", "client_version": "1.0.0"}
+# Every session fixture posts the same init body, so it is serialized once.
+_BASE_INIT_BODY = json.dumps(_BASE_INIT).encode("utf-8")
+_JSON_HEADERS = {"content-type": "application/json"}
+_PCM_META = {"sample_rate": 16000, "channels": 1, "format": "pcm_s16le"}
+_AUDIO_TEMPLATE = {
+    "chunk_type": "audio",
+    "sequence_number": 0,
+    "timestamp_ms": 1702080000000,
+    "meta": _PCM_META,
+}
+_FRAME_TEMPLATE = {
+    "chunk_type": "frame",
+    "sequence_number": 0,
+    "timestamp_ms": 1702080000000,
+}
+_UNKNOWN_SESSION_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+# Attributes of the lightweight modules installed in place of heavy
+# dependencies while the DAT server is under test.
+_STUB_SPEC: dict[str, dict[str, object]] = {
+    "src.smartglass_agent": {"SmartGlassAgent": FakeSmartGlassAgent},
+    "src.whisper_processor": {"WhisperAudioProcessor": object},
+    "src.clip_vision": {"CLIPVisionProcessor": object},
+    "src.gpt2_generator": {"GPT2TextGenerator": object},
+    "src.llm_backend": {"AnnLLMBackend": object, "LLMBackend": object},
+    "src.llm_snn_backend": {"SNNLLMBackend": object},
+    "src.audio": {"get_default_asr": lambda: None, "get_default_vad": lambda: None},
+    "src.fusion": {"ConfidenceFusion": object},
+    "src.perception": {
+        "get_default_keyframer": lambda: None,
+        "get_default_ocr": lambda: None,
+        "get_default_vq": lambda: None,
+    },
+    "src.policy": {"get_default_policy": lambda: None},
+    "privacy_flags": {
+        "should_store_audio": lambda: False,
+        "should_store_frames": lambda: False,
+        "should_store_transcripts": lambda: False,
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _stub_modules() -> dict[str, types.ModuleType]:
+    """Build the ``src`` package stub and dependency stubs once per process."""
     src_root = Path(__file__).resolve().parent.parent / "src"
     src_package = types.ModuleType("src")
     src_package.__path__ = [str(src_root)]
-    monkeypatch.setitem(sys.modules, "src", src_package)
-
-    # Stub out heavy dependencies
-    stubs: dict[str, types.ModuleType] = {}
-    for module_name, attributes in {
-        "src.smartglass_agent": {"SmartGlassAgent": FakeSmartGlassAgent},
-        "src.whisper_processor": {"WhisperAudioProcessor": object},
-        "src.clip_vision": {"CLIPVisionProcessor": object},
-        "src.gpt2_generator": {"GPT2TextGenerator": object},
-        "src.llm_backend": {"AnnLLMBackend": object, "LLMBackend": object},
-        "src.llm_snn_backend": {"SNNLLMBackend": object},
-        "src.audio": {"get_default_asr": lambda: None, "get_default_vad": lambda: None},
-        "src.fusion": {"ConfidenceFusion": object},
-        "src.perception": {
-            "get_default_keyframer": lambda: None,
-            "get_default_ocr": lambda: None,
-            "get_default_vq": lambda: None,
-        },
-        "src.policy": {"get_default_policy": lambda: None},
-        "privacy_flags": {
-            "should_store_audio": lambda: False,
-            "should_store_frames": lambda: False,
-            "should_store_transcripts": lambda: False,
-        },
-    }.items():
+
+    modules = {"src": src_package}
+    for module_name, attributes in _STUB_SPEC.items():
         stub = types.ModuleType(module_name)
         for attr, value in attributes.items():
             setattr(stub, attr, value)
-        stubs[module_name] = stub
-        monkeypatch.setitem(sys.modules, module_name, stub)
+        modules[module_name] = stub
+    return modules
+
+
+# uvicorn[standard] pulls in uvloop on Linux; when it is there, run the
+# TestClient's anyio event loop on it for cheaper request round-trips.
+_TESTCLIENT_BACKEND_OPTIONS: dict[str, object] = (
+    {"use_uvloop": True}
+    if platform.system() == "Linux" and importlib.util.find_spec("uvloop") is not None
+    else {}
+)
+
+# Server module imported under the DAT stubs, shared by every test class in
+# this process. Each pytest-xdist worker builds its own.
+_DAT_SERVER_MODULE: Optional[types.ModuleType] = None
+
+
+@pytest.fixture(name="dat_app", scope="class")
+def fixture_dat_app():
+    """Create FastAPI app configured for DAT testing with mock provider.
+
+    The app is built once per test class; tests that assert on metrics opt
+    into ``metrics_reset`` to start from an empty registry.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Use the same pattern as test_edge_runtime_server.py, but install the
+        # same stub module objects for every class instead of rebuilding them.
+        for module_name, module in _stub_modules().items():
+            monkeypatch.setitem(sys.modules, module_name, module)
+
+        # Set environment for mock provider
+        monkeypatch.setenv("PROVIDER", "mock")
+
+        # Import and configure server
+        from importlib import import_module
+
+        # The session_manager imports SmartGlassAgent locally in create_session()
+        # so we don't need to patch the module itself - the stub in sys.modules will be used
+        session_manager_module = import_module("src.edge_runtime.session_manager")
+
+        # Import the server once under this configuration instead of reloading
+        # it for every class. A copy cached by other test modules may have been
+        # built with different env (e.g. auth enabled), so it is never reused.
+        global _DAT_SERVER_MODULE
+        if _DAT_SERVER_MODULE is None:
+            monkeypatch.delitem(sys.modules, "src.edge_runtime.server", raising=False)
+            _DAT_SERVER_MODULE = import_module("src.edge_runtime.server")
+        else:
+            monkeypatch.setitem(sys.modules, "src.edge_runtime.server", _DAT_SERVER_MODULE)
+
+        yield _DAT_SERVER_MODULE.app
+
 
-    # Set environment for mock provider
-    monkeypatch.setenv("PROVIDER", "mock")
+@pytest.fixture(name="client", scope="class")
+def fixture_client(dat_app):
+    """Share one started TestClient across the tests of a class."""
+    with TestClient(dat_app, backend_options=_TESTCLIENT_BACKEND_OPTIONS) as client:
+        yield client
 
-    # Import and configure server
-    from importlib import import_module, reload
 
-    # The session_manager imports SmartGlassAgent locally in create_session()
-    # so we don't need to patch the module itself - the stub in sys.modules will be used
-    session_manager_module = import_module("src.edge_runtime.session_manager")
+@pytest.fixture(name="dat_session")
+def fixture_dat_session(client):
+    """Create a plain DAT session and return its id."""
+    return client.post(
+        "/dat/session",
+        content=_BASE_INIT_BODY,
+        headers=_JSON_HEADERS,
+    ).json()["session_id"]
 
-    server_module = import_module("src.edge_runtime.server")
-    reload(server_module)
 
-    metrics_module = import_module("src.utils.metrics")
-    metrics_module.metrics.reset()
+@pytest.fixture(name="sequence_session", scope="class")
+def fixture_sequence_session(client):
+    """DAT session shared by the per-chunk cases of a streaming sequence."""
+    return client.post(
+        "/dat/session",
+        content=_BASE_INIT_BODY,
+        headers=_JSON_HEADERS,
+    ).json()["session_id"]
 
-    return server_module.app
+
+@pytest.fixture(name="turn_ids", scope="session")
+def fixture_turn_ids():
+    """Iterator over turn ids drawn from a single ``os.urandom`` read."""
+    random_bytes = os.urandom(16 * 64)
+    return iter(
+        [
+            str(UUID(bytes=random_bytes[offset : offset + 16], version=4))
+            for offset in range(0, len(random_bytes), 16)
+        ]
+    )
+
+
+@pytest.fixture(name="metrics_reset")
+def fixture_metrics_reset(dat_app):
+    """Clear recorded metrics before a test that inspects them."""
+    from importlib import import_module
+
+    import_module("src.utils.metrics").metrics.reset()
 
 
 class TestDatSessionLifecycle:
     """Test complete DAT session workflow from init to completion."""
 
-    def test_dat_session_init_returns_session_id(self, dat_app):
+    def test_dat_session_init_returns_session_id(self, client):
         """Test DAT session initialization returns valid session ID and capabilities."""
-        client = TestClient(dat_app)
 
         # Initialize session with DAT protocol
         init_payload = {
@@ -151,9 +262,8 @@ class TestDatSessionLifecycle:
         except ValueError:
             pytest.fail(f"Session ID is not a valid UUID: {session_id}")
 
-    def test_dat_session_init_with_privacy_metadata(self, dat_app):
+    def test_dat_session_init_with_privacy_metadata(self, client):
         """Test DAT session initialization with privacy preferences in metadata."""
-        client = TestClient(dat_app)
 
         init_payload = {
             "device_id": "rayban-meta-test-12345",
@@ -173,24 +283,15 @@ class TestDatSessionLifecycle:
 class TestDatStreamingFlow:
     """Test DAT streaming endpoints with audio and frame chunks."""
 
-    def test_stream_audio_chunks_are_buffered(self, dat_app):
+    def test_stream_audio_chunks_are_buffered(self, client, dat_session):
         """Test audio chunks are accepted and buffered for later processing."""
-        client = TestClient(dat_app)
-
-        # Create session
-        session_id = client.post(
-            "/dat/session",
-            json={"device_id": "test-device", "client_version": "1.0.0"},
-        ).json()["session_id"]
+        session_id = dat_session
 
         # Send audio chunk
         audio_chunk = {
+            **_AUDIO_TEMPLATE,
             "session_id": session_id,
-            "chunk_type": "audio",
-            "sequence_number": 0,
-            "timestamp_ms": 1702080000000,
             "payload": _encode_pcm_s16le(duration_seconds=0.2),
-            "meta": {"sample_rate": 16000, "channels": 1, "format": "pcm_s16le"},
         }
 
         response = client.post("/dat/stream", json=audio_chunk)
@@ -201,21 +302,14 @@ class TestDatStreamingFlow:
         assert result["sequence_number"] == 0
         assert result["status"] == "buffered"
 
-    def test_stream_frame_chunks_are_buffered(self, dat_app):
+    def test_stream_frame_chunks_are_buffered(self, client, dat_session):
         """Test video frame chunks are accepted and buffered for later processing."""
-        client = TestClient(dat_app)
-
-        # Create session
-        session_id = client.post(
-            "/dat/session",
-            json={"device_id": "test-device", "client_version": "1.0.0"},
-        ).json()["session_id"]
+        session_id = dat_session
 
         # Send frame chunk
         frame_chunk = {
+            **_FRAME_TEMPLATE,
             "session_id": session_id,
-            "chunk_type": "frame",
-            "sequence_number": 0,
             "timestamp_ms": 1702080001000,
             "payload": _encode_test_image(size=64, color=(128, 128, 255)),
             "meta": {
@@ -234,55 +328,42 @@ class TestDatStreamingFlow:
         assert result["sequence_number"] == 0
         assert result["status"] == "buffered"
 
-    def test_stream_multiple_chunks_in_sequence(self, dat_app):
-        """Test streaming multiple audio and frame chunks with sequence numbers."""
-        client = TestClient(dat_app)
-
-        # Create session
-        session_id = client.post(
-            "/dat/session",
-            json={"device_id": "test-device", "client_version": "1.0.0"},
-        ).json()["session_id"]
-
-        # Stream multiple audio chunks
-        for i in range(3):
-            audio_chunk = {
-                "session_id": session_id,
-                "chunk_type": "audio",
-                "sequence_number": i,
-                "timestamp_ms": 1702080000000 + (i * 100),
-                "payload": _encode_pcm_s16le(duration_seconds=0.1),
-                "meta": {"sample_rate": 16000, "channels": 1, "format": "pcm_s16le"},
-            }
-            response = client.post("/dat/stream", json=audio_chunk)
-            assert response.status_code == 200
-            assert response.json()["sequence_number"] == i
+    @pytest.mark.parametrize("seq", range(3))
+    def test_stream_audio_chunks_in_sequence(self, client, sequence_session, seq):
+        """Test each audio chunk of a sequence is acknowledged with its sequence number."""
+        audio_chunk = {
+            **_AUDIO_TEMPLATE,
+            "session_id": sequence_session,
+            "sequence_number": seq,
+            "timestamp_ms": 1702080000000 + (seq * 100),
+            "payload": _encode_pcm_s16le(duration_seconds=0.1),
+        }
+        response = client.post("/dat/stream", json=audio_chunk)
+        assert response.status_code == 200
+        assert response.json()["sequence_number"] == seq
 
-        # Stream a couple of frames
-        for i in range(2):
-            frame_chunk = {
-                "session_id": session_id,
-                "chunk_type": "frame",
-                "sequence_number": 100 + i,  # Different sequence space
-                "timestamp_ms": 1702080000000 + (i * 500),
-                "payload": _encode_test_image(size=32),
-                "meta": {"width": 32, "height": 32, "format": "jpeg"},
-            }
-            response = client.post("/dat/stream", json=frame_chunk)
-            assert response.status_code == 200
-            assert response.json()["sequence_number"] == 100 + i
+    @pytest.mark.parametrize("seq", range(2))
+    def test_stream_frame_chunks_in_sequence(self, client, sequence_session, seq):
+        """Test frames interleaved into the same session use their own sequence space."""
+        frame_chunk = {
+            **_FRAME_TEMPLATE,
+            "session_id": sequence_session,
+            "sequence_number": 100 + seq,  # Different sequence space
+            "timestamp_ms": 1702080000000 + (seq * 500),
+            "payload": _encode_test_image(size=32),
+            "meta": {"width": 32, "height": 32, "format": "jpeg"},
+        }
+        response = client.post("/dat/stream", json=frame_chunk)
+        assert response.status_code == 200
+        assert response.json()["sequence_number"] == 100 + seq
 
-    def test_stream_chunk_rejects_unknown_session(self, dat_app):
+    def test_stream_chunk_rejects_unknown_session(self, client):
         """Test streaming to non-existent session returns 404."""
-        client = TestClient(dat_app)
 
         audio_chunk = {
-            "session_id": "550e8400-e29b-41d4-a716-446655440000",  # Doesn't exist
-            "chunk_type": "audio",
-            "sequence_number": 0,
-            "timestamp_ms": 1702080000000,
+            **_AUDIO_TEMPLATE,
+            "session_id": _UNKNOWN_SESSION_ID,  # Doesn't exist
             "payload": _encode_pcm_s16le(),
-            "meta": {"sample_rate": 16000, "channels": 1, "format": "pcm_s16le"},
         }
 
         response = client.post("/dat/stream", json=audio_chunk)
@@ -293,31 +374,21 @@ class TestDatStreamingFlow:
 class TestDatTurnCompletion:
     """Test turn completion and agent response generation."""
 
-    def test_turn_complete_returns_response_structure(self, dat_app):
+    def test_turn_complete_returns_response_structure(self, client, dat_session, turn_ids):
         """Test turn completion returns expected response structure with transcript and actions."""
-        client = TestClient(dat_app)
-
-        # Create session
-        session_id = client.post(
-            "/dat/session",
-            json={"device_id": "test-device", "client_version": "1.0.0"},
-        ).json()["session_id"]
+        session_id = dat_session
 
         # Stream some data first
         audio_chunk = {
+            **_AUDIO_TEMPLATE,
             "session_id": session_id,
-            "chunk_type": "audio",
-            "sequence_number": 0,
-            "timestamp_ms": 1702080000000,
             "payload": _encode_pcm_s16le(duration_seconds=0.2),
-            "meta": {"sample_rate": 16000, "channels": 1, "format": "pcm_s16le"},
         }
         client.post("/dat/stream", json=audio_chunk)
 
         frame_chunk = {
+            **_FRAME_TEMPLATE,
             "session_id": session_id,
-            "chunk_type": "frame",
-            "sequence_number": 0,
             "timestamp_ms": 1702080000500,
             "payload": _encode_test_image(size=64),
             "meta": {"width": 64, "height": 64, "format": "jpeg"},
@@ -327,7 +398,7 @@ class TestDatTurnCompletion:
         # Complete turn
         turn_request = {
             "session_id": session_id,
-            "turn_id": str(uuid4()),
+            "turn_id": next(turn_ids),
             "query_text": "What do I see?",
             "language": "en",
             "cloud_offload": False,
@@ -364,20 +435,14 @@ class TestDatTurnCompletion:
         #     assert "priority" in action
         #     assert "parameters" in action
 
-    def test_turn_complete_without_streaming_data(self, dat_app):
+    def test_turn_complete_without_streaming_data(self, client, dat_session, turn_ids):
         """Test turn completion works even without prior stream chunks (text-only query)."""
-        client = TestClient(dat_app)
-
-        # Create session
-        session_id = client.post(
-            "/dat/session",
-            json={"device_id": "test-device", "client_version": "1.0.0"},
-        ).json()["session_id"]
+        session_id = dat_session
 
         # Complete turn without streaming any audio/frames
         turn_request = {
             "session_id": session_id,
-            "turn_id": str(uuid4()),
+            "turn_id": next(turn_ids),
             "query_text": "Hello, what's the weather?",
             "language": "en",
         }
@@ -390,13 +455,12 @@ class TestDatTurnCompletion:
         assert result["transcript"] == "Hello, what's the weather?"
         assert isinstance(result["actions"], list)
 
-    def test_turn_complete_rejects_unknown_session(self, dat_app):
+    def test_turn_complete_rejects_unknown_session(self, client, turn_ids):
         """Test turn completion for non-existent session returns 404."""
-        client = TestClient(dat_app)
 
         turn_request = {
-            "session_id": "550e8400-e29b-41d4-a716-446655440000",  # Doesn't exist
-            "turn_id": str(uuid4()),
+            "session_id": _UNKNOWN_SESSION_ID,  # Doesn't exist
+            "turn_id": next(turn_ids),
         }
 
         response = client.post("/dat/turn/complete", json=turn_request)
@@ -407,7 +471,7 @@ class TestDatTurnCompletion:
 class TestDatEndToEndFlow:
     """Test complete end-to-end DAT workflow simulating real app usage."""
 
-    def test_complete_multimodal_turn_flow(self, dat_app):
+    def test_complete_multimodal_turn_flow(self, dat_app, client, turn_ids):
         """
         Test complete workflow: init -> stream audio -> stream frames -> complete turn.
         
@@ -417,7 +481,6 @@ class TestDatEndToEndFlow:
         3. Stream keyframes at intervals (simulating camera)
         4. Finalize turn to get agent response with actions
         """
-        client = TestClient(dat_app)
 
         # Step 1: Initialize DAT session
         init_response = client.post(
@@ -442,33 +505,24 @@ class TestDatEndToEndFlow:
 
         # Step 2: Stream audio chunks (simulate ~400ms of audio)
         base_timestamp = 1702080000000
-        audio_sequence = 0
-        for i in range(4):  # 4 chunks of 100ms each
-            audio_chunk = {
+        audio_chunks = [
+            {
+                **_AUDIO_TEMPLATE,
                 "session_id": session_id,
-                "chunk_type": "audio",
-                "sequence_number": audio_sequence,
+                "sequence_number": i,
                 "timestamp_ms": base_timestamp + (i * 100),
                 "payload": _encode_pcm_s16le(duration_seconds=0.1),
-                "meta": {
-                    "sample_rate": 16000,
-                    "channels": 1,
-                    "format": "pcm_s16le",
-                    "duration_ms": 100,
-                },
+                "meta": {**_PCM_META, "duration_ms": 100},
             }
-            response = client.post("/dat/stream", json=audio_chunk)
-            assert response.status_code == 200
-            assert response.json()["status"] == "buffered"
-            audio_sequence += 1
+            for i in range(4)  # 4 chunks of 100ms each
+        ]
 
         # Step 3: Stream frame chunks (simulate keyframes at 500ms intervals)
-        frame_sequence = 0
-        for i in range(2):  # 2 keyframes
-            frame_chunk = {
+        frame_chunks = [
+            {
+                **_FRAME_TEMPLATE,
                 "session_id": session_id,
-                "chunk_type": "frame",
-                "sequence_number": frame_sequence,
+                "sequence_number": i,
                 "timestamp_ms": base_timestamp + (i * 500),
                 "payload": _encode_test_image(size=128, color=(100, 150, 200)),
                 "meta": {
@@ -479,13 +533,27 @@ class TestDatEndToEndFlow:
                     "is_keyframe": True,
                 },
             }
-            response = client.post("/dat/stream", json=frame_chunk)
+            for i in range(2)  # 2 keyframes
+        ]
+
+        # The server buffers each chunk independently, so the uploads are
+        # issued concurrently; only the turn completion below is ordered.
+        async def _stream_chunks() -> list[httpx.Response]:
+            transport = httpx.ASGITransport(app=dat_app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+                return await asyncio.gather(
+                    *(
+                        async_client.post("/dat/stream", json=chunk)
+                        for chunk in audio_chunks + frame_chunks
+                    )
+                )
+
+        for response in asyncio.run(_stream_chunks()):
             assert response.status_code == 200
             assert response.json()["status"] == "buffered"
-            frame_sequence += 1
 
         # Step 4: Complete turn and get agent response
-        turn_id = str(uuid4())
+        turn_id = next(turn_ids)
         turn_response = client.post(
             "/dat/turn/complete",
             json={
@@ -522,33 +590,23 @@ class TestDatEndToEndFlow:
         #     assert "parameters" in action
         #     assert isinstance(action["parameters"], dict)
 
-    def test_metrics_track_dat_operations(self, dat_app):
+    @pytest.mark.usefixtures("metrics_reset")
+    def test_metrics_track_dat_operations(self, client, dat_session, turn_ids):
         """Test that DAT operations are tracked in metrics for monitoring."""
-        client = TestClient(dat_app)
-
-        # Create session and stream data
-        session_id = client.post(
-            "/dat/session",
-            json={"device_id": "test-device", "client_version": "1.0.0"},
-        ).json()["session_id"]
+        session_id = dat_session
 
         # Stream audio chunk (should record dat_ingest_audio_latency_ms)
         audio_chunk = {
+            **_AUDIO_TEMPLATE,
             "session_id": session_id,
-            "chunk_type": "audio",
-            "sequence_number": 0,
-            "timestamp_ms": 1702080000000,
             "payload": _encode_pcm_s16le(),
-            "meta": {"sample_rate": 16000, "channels": 1, "format": "pcm_s16le"},
         }
         client.post("/dat/stream", json=audio_chunk)
 
         # Stream frame chunk (should record dat_ingest_frame_latency_ms)
         frame_chunk = {
+            **_FRAME_TEMPLATE,
             "session_id": session_id,
-            "chunk_type": "frame",
-            "sequence_number": 0,
-            "timestamp_ms": 1702080000000,
             "payload": _encode_test_image(),
             "meta": {"width": 64, "height": 64, "format": "jpeg"},
         }
@@ -557,7 +615,7 @@ class TestDatEndToEndFlow:
         # Complete turn (should record end_to_end_turn_latency_ms)
         turn_request = {
             "session_id": session_id,
-            "turn_id": str(uuid4()),
+            "turn_id": next(turn_ids),
             "query_text": "Test query",
         }
         client.post("/dat/turn/complete", json=turn_request)
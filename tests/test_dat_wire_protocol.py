@@ -15,18 +15,12 @@ This pattern is specific to testing modules that don't actually need the heavy
 dependencies but are located in the src/ package.
 """
 
-import importlib.util
-import sys
-from pathlib import Path
-
 import pytest
 from pydantic import ValidationError
 
-# Import the wire protocol module directly without triggering src/__init__.py
-wire_protocol_path = Path(__file__).parent.parent / "src" / "wire" / "dat_protocol.py"
-spec = importlib.util.spec_from_file_location("dat_protocol", wire_protocol_path)
-dat_protocol = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(dat_protocol)
+from tests._dat_protocol import load_dat_protocol
+
+dat_protocol = load_dat_protocol()
 
 # Import all needed classes from the module
 Action = dat_protocol.Action
@@ -49,41 +43,62 @@ StreamChunkResponse = dat_protocol.StreamChunkResponse
 TurnCompleteRequest = dat_protocol.TurnCompleteRequest
 TurnCompleteResponse = dat_protocol.TurnCompleteResponse
 
-# Rebuild Pydantic models to resolve forward references with proper namespace
-# Include the module's namespace so typing annotations can be resolved
-import typing
-from typing import Optional, Union, Any, Dict, List
-namespace = {
-    'ClientCapabilities': ClientCapabilities,
-    'ServerCapabilities': ServerCapabilities,
-    'AudioMeta': AudioMeta,
-    'FrameMeta': FrameMeta,
-    'ImuMeta': ImuMeta,
-    'ChunkType': ChunkType,
-    'ChunkStatus': ChunkStatus,
-    'ActionType': ActionType,
-    'Priority': Priority,
-    'ErrorCode': ErrorCode,
-    'ResponseMetadata': ResponseMetadata,
-    'Action': Action,
-    'Optional': Optional,
-    'Union': Union,
-    'Any': Any,
-    'Dict': Dict,
-    'List': List,
-    'list': list,
-}
-
-for model in [ClientCapabilities, ServerCapabilities, AudioMeta, FrameMeta, ImuMeta,
+
+def _rebuild_namespace():
+    """Names needed to resolve the models' forward references.
+
+    Only built when some model is left incomplete at import.
+    """
+    from typing import Optional, Union, Any, Dict, List
+
+    return {
+        'ClientCapabilities': ClientCapabilities,
+        'ServerCapabilities': ServerCapabilities,
+        'AudioMeta': AudioMeta,
+        'FrameMeta': FrameMeta,
+        'ImuMeta': ImuMeta,
+        'ChunkType': ChunkType,
+        'ChunkStatus': ChunkStatus,
+        'ActionType': ActionType,
+        'Priority': Priority,
+        'ErrorCode': ErrorCode,
+        'ResponseMetadata': ResponseMetadata,
+        'Action': Action,
+        'Optional': Optional,
+        'Union': Union,
+        'Any': Any,
+        'Dict': Dict,
+        'List': List,
+        'list': list,
+    }
+
+
+# Only models left incomplete by unresolved forward references need a rebuild;
+# the rest already have their core schema.
+namespace = None
+for model in (ClientCapabilities, ServerCapabilities, AudioMeta, FrameMeta, ImuMeta,
               SessionInitRequest, SessionInitResponse, StreamChunk, StreamChunkResponse,
               TurnCompleteRequest, TurnCompleteResponse, Action, ErrorResponse,
-              ResponseMetadata]:
-    if hasattr(model, 'model_rebuild'):
-        try:
-            model.model_rebuild(_types_namespace=namespace)
-        except Exception:
-            # If rebuild fails, continue - tests may still work
-            pass
+              ResponseMetadata):
+    if getattr(model, '__pydantic_complete__', True):
+        continue
+    if namespace is None:
+        namespace = _rebuild_namespace()
+    # If rebuild fails, continue - tests may still work
+    model.model_rebuild(_types_namespace=namespace, raise_errors=False)
+
+
+SESSION_ID = "550e8400-e29b-41d4-a716-446655440000"
+TURN_ID = "660e8400-e29b-41d4-a716-446655440001"
+
+
+def _mk_action(**kwargs):
+    """Build a trusted ``Action`` fixture without running validation.
+
+    Only for tests whose subject is the enclosing model; ``Action`` validation
+    itself is covered by ``test_action_valid``.
+    """
+    return Action.model_construct(**kwargs)
 
 
 class TestSessionInitModels:
@@ -127,10 +142,10 @@ class TestSessionInitModels:
     def test_session_init_response_valid(self):
         """Test valid SessionInitResponse creation."""
         response = SessionInitResponse(
-            session_id="550e8400-e29b-41d4-a716-446655440000",
+            session_id=SESSION_ID,
             server_version="0.1.0",
         )
-        assert response.session_id == "550e8400-e29b-41d4-a716-446655440000"
+        assert response.session_id == SESSION_ID
         assert response.server_version == "0.1.0"
         assert response.max_chunk_size_bytes == 1048576  # Default 1MB
 
@@ -159,23 +174,29 @@ class TestStreamChunkModels:
         assert meta.channels == 1
         assert meta.format == "pcm_s16le"
 
-    def test_audio_meta_invalid_sample_rate(self):
-        """Test AudioMeta rejects invalid sample rate."""
+    @pytest.mark.parametrize(
+        ("model_cls", "kwargs", "field"),
+        [
+            # sample_rate not in the allowed list
+            (AudioMeta, {"sample_rate": 12345, "channels": 1}, "sample_rate"),
+            # channels must be 1 or 2
+            (AudioMeta, {"sample_rate": 16000, "channels": 5}, "channels"),
+            # width must be > 0
+            (FrameMeta, {"width": 0, "height": 1080, "format": "jpeg"}, "width"),
+            (ImuMeta, {"sensor_type": "invalid_sensor", "sample_count": 10}, "sensor_type"),
+        ],
+        ids=[
+            "audio-sample-rate",
+            "audio-channels",
+            "frame-dimensions",
+            "imu-sensor-type",
+        ],
+    )
+    def test_meta_rejects_invalid_field(self, model_cls, kwargs, field):
+        """Test chunk metadata models reject out-of-range fields."""
         with pytest.raises(ValidationError) as exc_info:
-            AudioMeta(
-                sample_rate=12345,  # Not in allowed list
-                channels=1,
-            )
-        assert "sample_rate" in str(exc_info.value)
-
-    def test_audio_meta_invalid_channels(self):
-        """Test AudioMeta rejects invalid channel count."""
-        with pytest.raises(ValidationError) as exc_info:
-            AudioMeta(
-                sample_rate=16000,
-                channels=5,  # Must be 1 or 2
-            )
-        assert "channels" in str(exc_info.value)
+            model_cls(**kwargs)
+        assert field in str(exc_info.value)
 
     def test_frame_meta_valid(self):
         """Test valid FrameMeta creation."""
@@ -191,15 +212,6 @@ class TestStreamChunkModels:
         assert meta.format == "jpeg"
         assert meta.quality == 85
 
-    def test_frame_meta_invalid_dimensions(self):
-        """Test FrameMeta rejects invalid dimensions."""
-        with pytest.raises(ValidationError):
-            FrameMeta(
-                width=0,  # Must be > 0
-                height=1080,
-                format="jpeg",
-            )
-
     def test_imu_meta_valid(self):
         """Test valid ImuMeta creation."""
         meta = ImuMeta(
@@ -209,19 +221,10 @@ class TestStreamChunkModels:
         assert meta.sensor_type == "accelerometer"
         assert meta.sample_count == 10
 
-    def test_imu_meta_invalid_sensor_type(self):
-        """Test ImuMeta rejects invalid sensor type."""
-        with pytest.raises(ValidationError) as exc_info:
-            ImuMeta(
-                sensor_type="invalid_sensor",
-                sample_count=10,
-            )
-        assert "sensor_type" in str(exc_info.value)
-
     def test_stream_chunk_audio(self):
         """Test StreamChunk with audio data."""
         chunk = StreamChunk(
-            session_id="550e8400-e29b-41d4-a716-446655440000",
+            session_id=SESSION_ID,
             chunk_type=ChunkType.AUDIO,
             sequence_number=0,
             timestamp_ms=1702080000000,
@@ -236,7 +239,7 @@ class TestStreamChunkModels:
     def test_stream_chunk_frame(self):
         """Test StreamChunk with frame data."""
         chunk = StreamChunk(
-            session_id="550e8400-e29b-41d4-a716-446655440000",
+            session_id=SESSION_ID,
             chunk_type=ChunkType.FRAME,
             sequence_number=1,
             timestamp_ms=1702080001000,
@@ -250,7 +253,7 @@ class TestStreamChunkModels:
     def test_stream_chunk_response(self):
         """Test StreamChunkResponse creation."""
         response = StreamChunkResponse(
-            session_id="550e8400-e29b-41d4-a716-446655440000",
+            session_id=SESSION_ID,
             sequence_number=5,
             status=ChunkStatus.BUFFERED,
             message="Chunk received successfully",
@@ -265,18 +268,18 @@ class TestTurnCompleteModels:
     def test_turn_complete_request_minimal(self):
         """Test TurnCompleteRequest with minimal fields."""
         request = TurnCompleteRequest(
-            session_id="550e8400-e29b-41d4-a716-446655440000",
-            turn_id="660e8400-e29b-41d4-a716-446655440001",
+            session_id=SESSION_ID,
+            turn_id=TURN_ID,
         )
-        assert request.session_id == "550e8400-e29b-41d4-a716-446655440000"
-        assert request.turn_id == "660e8400-e29b-41d4-a716-446655440001"
+        assert request.session_id == SESSION_ID
+        assert request.turn_id == TURN_ID
         assert request.cloud_offload is False
 
     def test_turn_complete_request_with_query(self):
         """Test TurnCompleteRequest with explicit query text."""
         request = TurnCompleteRequest(
-            session_id="550e8400-e29b-41d4-a716-446655440000",
-            turn_id="660e8400-e29b-41d4-a716-446655440001",
+            session_id=SESSION_ID,
+            turn_id=TURN_ID,
             query_text="What am I looking at?",
             language="en",
             cloud_offload=True,
@@ -289,8 +292,8 @@ class TestTurnCompleteModels:
         """Test TurnCompleteRequest rejects invalid language code."""
         with pytest.raises(ValidationError) as exc_info:
             TurnCompleteRequest(
-                session_id="550e8400-e29b-41d4-a716-446655440000",
-                turn_id="660e8400-e29b-41d4-a716-446655440001",
+                session_id=SESSION_ID,
+                turn_id=TURN_ID,
                 language="english",  # Must be ISO 639-1
             )
         assert "language" in str(exc_info.value)
@@ -309,17 +312,17 @@ class TestTurnCompleteModels:
     def test_turn_complete_response_with_actions(self):
         """Test TurnCompleteResponse with multiple actions."""
         response = TurnCompleteResponse(
-            session_id="550e8400-e29b-41d4-a716-446655440000",
-            turn_id="660e8400-e29b-41d4-a716-446655440001",
+            session_id=SESSION_ID,
+            turn_id=TURN_ID,
             response="I can see a coffee shop. Would you like directions?",
             transcript="What am I looking at?",
             actions=[
-                Action(
+                _mk_action(
                     action_type=ActionType.NAVIGATE,
                     parameters={"destination": "Starbucks"},
                     priority=Priority.NORMAL,
                 ),
-                Action(
+                _mk_action(
                     action_type=ActionType.SHOW_TEXT,
                     parameters={"text": "Coffee shop ahead"},
                     priority=Priority.LOW,
@@ -339,11 +342,11 @@ class TestErrorResponse:
         error = ErrorResponse(
             error=ErrorCode.INVALID_SESSION,
             message="Session not found",
-            details={"session_id": "550e8400-e29b-41d4-a716-446655440000"},
+            details={"session_id": SESSION_ID},
         )
         assert error.error == ErrorCode.INVALID_SESSION
         assert error.message == "Session not found"
-        assert error.details["session_id"] == "550e8400-e29b-41d4-a716-446655440000"
+        assert error.details["session_id"] == SESSION_ID
 
 
 class TestEnums:
@@ -385,7 +388,7 @@ class TestModelSerialization:
     def test_stream_chunk_deserialization(self):
         """Test StreamChunk can be deserialized from JSON."""
         json_data = {
-            "session_id": "550e8400-e29b-41d4-a716-446655440000",
+            "session_id": SESSION_ID,
             "chunk_type": "audio",
             "sequence_number": 0,
             "timestamp_ms": 1702080000000,
@@ -396,19 +399,19 @@ class TestModelSerialization:
                 "format": "pcm_s16le",
             },
         }
-        chunk = StreamChunk(**json_data)
+        chunk = StreamChunk.model_validate(json_data)
         assert chunk.chunk_type == ChunkType.AUDIO
         assert chunk.meta.sample_rate == 16000
 
     def test_turn_complete_response_full_cycle(self):
         """Test TurnCompleteResponse serialization and deserialization."""
         response = TurnCompleteResponse(
-            session_id="550e8400-e29b-41d4-a716-446655440000",
-            turn_id="660e8400-e29b-41d4-a716-446655440001",
+            session_id=SESSION_ID,
+            turn_id=TURN_ID,
             response="Test response",
             transcript="Test query",
             actions=[
-                Action(
+                _mk_action(
                     action_type=ActionType.NAVIGATE,
                     parameters={"destination": "Test"},
                 )
@@ -419,7 +422,7 @@ class TestModelSerialization:
         json_data = response.model_dump()
         
         # Deserialize
-        restored = TurnCompleteResponse(**json_data)
+        restored = TurnCompleteResponse.model_validate(json_data)
         assert restored.session_id == response.session_id
         assert restored.turn_id == response.turn_id
         assert restored.response == response.response
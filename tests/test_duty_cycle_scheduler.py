@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import heapq
-from pathlib import Path
-from typing import Callable, Iterable, List
+from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 
 from bench.phone_perf_timeline import (
     TIMELINE_DURATION_S,
@@ -12,52 +11,27 @@ from bench.phone_perf_timeline import (
     state_for_time,
 )
 from controls import DutyCycleScheduler
-from fsm import EngagementState, HandshakeFSM, HandshakeState, load_handshake_budgets
+from fsm import EngagementState, HandshakeFSM, HandshakeState
 from rayskillkit import RaySkillKitRuntime
+from tests._fake_timer import FakeTimer
+from tests._handshake_budgets import BUDGETS
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-class FakeTimerHandle:
-    def __init__(self, callback: Callable[[], None], deadline: float) -> None:
-        self._callback = callback
-        self.deadline = deadline
-        self.cancelled = False
 
-    def cancel(self) -> None:
-        self.cancelled = True
-
-    def __lt__(self, other: "FakeTimerHandle") -> bool:
-        return self.deadline < other.deadline
-
-    def fire(self) -> None:
-        if not self.cancelled:
-            self._callback()
-
-
-class FakeTimer:
-    def __init__(self) -> None:
-        self._now = 0.0
-        self._queue: List[FakeTimerHandle] = []
-
-    def now(self) -> float:
-        return self._now
-
-    def call_later(self, delay: float, callback: Callable[[], None]) -> FakeTimerHandle:
-        handle = FakeTimerHandle(callback, self._now + delay)
-        heapq.heappush(self._queue, handle)
-        return handle
-
-    def advance(self, delta: float) -> None:
-        self._now += delta
-        while self._queue and self._queue[0].deadline <= self._now:
-            handle = heapq.heappop(self._queue)
-            handle.fire()
+# Inference inputs shared by every test; read-only so no fake model can
+# modify them in place.
+FEATURES_8 = np.ones(8, dtype=np.float32)
+FEATURES_8.flags.writeable = False
+FEATURES_4 = np.ones(4, dtype=np.float32)
+FEATURES_4.flags.writeable = False
 
 
 def _build_fsm() -> tuple[HandshakeFSM, FakeTimer, float]:
-    budgets = load_handshake_budgets(Path("config/ux_budgets.yaml"))
     timer = FakeTimer()
-    fsm = HandshakeFSM(timer=timer, budgets=budgets)
-    return fsm, timer, budgets.degrade_p50
+    fsm = HandshakeFSM(timer=timer, budgets=BUDGETS)
+    return fsm, timer, BUDGETS.degrade_p50
 
 
 class _CountingOrt:
@@ -69,24 +43,45 @@ class _CountingOrt:
         return features
 
 
-def _simulate_timeline(idle_hz: float) -> tuple[int, List[float]]:
-    fsm, timer, _ = _build_fsm()
+def _build_request_timeline() -> tuple[tuple[float, EngagementState], ...]:
+    """Return every ``(request_time, engagement)`` pair of the bench timeline."""
+
+    timeline: list[tuple[float, EngagementState]] = []
+    request_time = 0.0
+    while request_time < TIMELINE_DURATION_S:
+        label = state_for_time(request_time)
+        target = EngagementState.ACTIVE if label == "active" else EngagementState.IDLE
+        timeline.append((request_time, target))
+        request_time = round(request_time + TIMELINE_REQUEST_INTERVAL_S, 10)
+    return tuple(timeline)
+
+
+# Shared by every simulation run; the timeline itself is deterministic.
+REQUEST_TIMELINE = _build_request_timeline()
+
+
+def _simulate_timeline(idle_hz: float) -> tuple[int, list[float]]:
+    fsm, timer, degrade_p50 = _build_fsm()
+    if idle_hz == 0.0 and TIMELINE_REQUEST_INTERVAL_S < degrade_p50:
+        # Ungated baseline: with both rates at 0 Hz the scheduler admits every
+        # request, and a heartbeat per request keeps the handshake READY, so
+        # each request on the timeline reaches the model without delay.
+        return len(REQUEST_TIMELINE), []
+
     scheduler = DutyCycleScheduler(timer, idle_hz=idle_hz, active_hz=0.0)
     runtime = RaySkillKitRuntime(handshake=fsm, scheduler=scheduler)
     ort = _CountingOrt()
-    features = np.ones(8, dtype=np.float32)
+    features = FEATURES_8
     fsm.pair()
     fsm.mark_user_idle()
     current_state = EngagementState.IDLE
-    latencies: List[float] = []
+    latencies: list[float] = []
     pending_start: float | None = None
 
-    request_time = 0.0
-    while request_time < TIMELINE_DURATION_S:
-        label = state_for_time(request_time)
-        target = EngagementState.ACTIVE if label == "active" else EngagementState.IDLE
+    active = EngagementState.ACTIVE
+    for request_time, target in REQUEST_TIMELINE:
         if target is not current_state:
-            if target is EngagementState.ACTIVE:
+            if target is active:
                 fsm.mark_user_active()
             else:
                 fsm.mark_user_idle()
@@ -102,14 +97,12 @@ def _simulate_timeline(idle_hz: float) -> tuple[int, List[float]]:
             latencies.append(timer.now() - pending_start)
             pending_start = None
 
-        request_time = round(request_time + TIMELINE_REQUEST_INTERVAL_S, 10)
-
     return ort.calls, latencies
 
 
 def test_ready_state_emits_idle_and_active_callbacks() -> None:
     fsm, timer, degrade_p50 = _build_fsm()
-    events: List[EngagementState] = []
+    events: list[EngagementState] = []
     fsm.subscribe_engagement(events.append)
 
     fsm.pair()
@@ -157,7 +150,7 @@ def test_runtime_gates_camera_and_inference() -> None:
 
     class Ort:
         def __init__(self) -> None:
-            self.calls: List[str] = []
+            self.calls: list[str] = []
 
         def infer(self, model_name: str, features: np.ndarray) -> np.ndarray:
             self.calls.append(model_name)
@@ -180,7 +173,7 @@ def test_runtime_gates_camera_and_inference() -> None:
     timer.advance(0.5)
     assert runtime.capture_clip(camera) is not None
 
-    features = np.ones(4, dtype=np.float32)
+    features = FEATURES_4
     assert runtime.run_inference(ort, "demo", features) is None
 
     fsm.mark_user_active()
@@ -196,6 +189,7 @@ def test_runtime_gates_camera_and_inference() -> None:
     assert runtime.run_inference(ort, "demo", features) is not None
 
 
+@pytest.mark.slow
 def test_duty_cycle_timeline_saves_tokens_and_bounds_latency() -> None:
     baseline_calls, _ = _simulate_timeline(idle_hz=0.0)
     duty_calls, duty_latencies = _simulate_timeline(idle_hz=2.0)
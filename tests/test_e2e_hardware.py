@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 """Comprehensive E2E test suite for hardware validation."""
+import argparse
+import functools
+import itertools
 import time
 import sys
 import os
+from types import SimpleNamespace
 from typing import List, Dict, Any
 
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import numpy as np
 
 # Test query categories
 VISUAL_QA_QUERIES = [
@@ -57,8 +60,16 @@ ALL_QUERIES = (
     GENERAL_ASSISTANCE_QUERIES
 )
 
+# Queries that are sent with an image attached.
+VISION_QUERIES = frozenset(VISUAL_QA_QUERIES) | frozenset(OCR_TRANSLATION_QUERIES)
+
 def run_e2e_test(agent, query: str, needs_vision: bool = False) -> Dict[str, Any]:
-    """Run single E2E test query."""
+    """Run single E2E test query.
+
+    Failures reported in the reply (an ``"error"`` entry) are recorded
+    without raising; the ``except`` branch only covers agents that raise.
+    A reply that is not a dict is recorded as a failure too.
+    """
     start = time.perf_counter()
     
     try:
@@ -67,27 +78,38 @@ def run_e2e_test(agent, query: str, needs_vision: bool = False) -> Dict[str, Any
             text_query=query,
             image_input=None if not needs_vision else "mock_image.jpg",
         )
-        
-        latency = (time.perf_counter() - start) * 1000
-        
-        return {
-            "query": query,
-            "success": True,
-            "latency_ms": latency,
-            "response": result.get("response", ""),
-            "actions": result.get("actions", []),
-        }
     except Exception as e:
-        latency = (time.perf_counter() - start) * 1000
+        result = {"error": e}
+
+    latency = (time.perf_counter() - start) * 1000
+
+    if not isinstance(result, dict):
+        error = f"unexpected reply type {type(result).__name__}"
+    else:
+        error = result.get("error")
+    if error:
         return {
             "query": query,
             "success": False,
             "latency_ms": latency,
-            "error": str(e),
+            "error": str(error),
         }
 
-def main(num_queries=100):
-    """Run comprehensive E2E test suite."""
+    return {
+        "query": query,
+        "success": True,
+        "latency_ms": latency,
+        "response": result.get("response", ""),
+        "actions": result.get("actions", []),
+    }
+
+def main(num_queries=100, cache_replies=False):
+    """Run comprehensive E2E test suite.
+
+    With ``cache_replies`` the harness memoizes agent replies per
+    ``(query, image)`` pair, so repeated queries skip inference. Cache hits
+    are counted separately and left out of the latency statistics.
+    """
     try:
         from src.smartglass_agent import SmartGlassAgent
     except ImportError:
@@ -96,6 +118,12 @@ def main(num_queries=100):
     
     print(f"Initializing SmartGlassAgent...")
     agent = SmartGlassAgent()
+    cached_reply = None
+    query_agent = agent
+    if cache_replies:
+        # Harness-side only; the agent itself is left untouched.
+        cached_reply = functools.lru_cache(maxsize=64)(agent.process_multimodal_query)
+        query_agent = SimpleNamespace(process_multimodal_query=cached_reply)
     
     print(f"\nRunning {num_queries} E2E test queries...")
     print("=" * 60)
@@ -103,19 +131,25 @@ def main(num_queries=100):
     results: List[Dict[str, Any]] = []
     successes = 0
     failures = 0
+    cache_hits = 0
     latencies = []
     
     # Run test queries
-    for i in range(num_queries):
-        query = ALL_QUERIES[i % len(ALL_QUERIES)]
-        needs_vision = query in VISUAL_QA_QUERIES or query in OCR_TRANSLATION_QUERIES
+    queries = itertools.islice(itertools.cycle(ALL_QUERIES), num_queries)
+    for i, query in enumerate(queries):
+        needs_vision = query in VISION_QUERIES
         
-        result = run_e2e_test(agent, query, needs_vision)
+        hits_before = cached_reply.cache_info().hits if cached_reply else 0
+        result = run_e2e_test(query_agent, query, needs_vision)
+        result["cache_hit"] = cached_reply is not None and cached_reply.cache_info().hits > hits_before
         results.append(result)
         
         if result["success"]:
             successes += 1
-            latencies.append(result["latency_ms"])
+            if result["cache_hit"]:
+                cache_hits += 1
+            else:
+                latencies.append(result["latency_ms"])
             status = "✅"
         else:
             failures += 1
@@ -128,11 +162,9 @@ def main(num_queries=100):
     success_rate = (successes / num_queries) * 100
     
     if latencies:
-        latencies_sorted = sorted(latencies)
-        n = len(latencies_sorted)
-        mean_latency = sum(latencies) / len(latencies)
-        p95_latency = latencies_sorted[int(n * 0.95)]
-        p99_latency = latencies_sorted[int(n * 0.99)]
+        latency_array = np.asarray(latencies)
+        mean_latency = float(latency_array.mean())
+        p95_latency, p99_latency = (float(p) for p in np.percentile(latency_array, [95, 99]))
     else:
         mean_latency = p95_latency = p99_latency = 0
     
@@ -144,6 +176,8 @@ def main(num_queries=100):
     print(f"Successes: {successes}")
     print(f"Failures: {failures}")
     print(f"Success rate: {success_rate:.1f}%")
+    if cache_replies:
+        print(f"Cache hits (excluded from latency): {cache_hits}")
     print(f"\nLatency Statistics:")
     print(f"  Mean: {mean_latency:.2f}ms")
     print(f"  P95: {p95_latency:.2f}ms")
@@ -174,6 +208,16 @@ def main(num_queries=100):
     return 0 if all_pass else 1
 
 if __name__ == "__main__":
-    num_queries = int(sys.argv[1]) if len(sys.argv) > 1 else 100
-    exit_code = main(num_queries)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("num_queries", nargs="?", type=int, default=100)
+    parser.add_argument(
+        "--cache-replies",
+        action="store_true",
+        help="reuse agent replies for repeated queries; hits are left out of latency figures",
+    )
+    args = parser.parse_args()
+    # Running as a script puts tests/ on sys.path rather than the repo root;
+    # under pytest the root comes from pytest.ini's pythonpath setting.
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    exit_code = main(args.num_queries, cache_replies=args.cache_replies)
     sys.exit(exit_code)
@@ -5,6 +5,7 @@ from unittest import mock
 
 import numpy as np
 import pytest
+import yaml
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -15,56 +16,69 @@ from calibration.clip_calibrate import ClipCalibrator
 
 CONFIG_PATH = ROOT / "config" / "calibration.yaml"
 
+# Temperature that maps the dataset's 0.9 confidence onto its 0.6 accuracy.
+TAU_EXPECTED = np.log(0.9 / 0.1) / np.log(0.6 / 0.4)
+
+
+@pytest.fixture(name="calibration_config", scope="module")
+def fixture_calibration_config():
+    """Parse the calibration config once; each test still gets its own calibrator."""
+    with CONFIG_PATH.open("r", encoding="utf-8") as fh:
+        return yaml.safe_load(fh)
+
 
 def make_temperature_dataset(num_samples: int = 200):
     rng = np.random.default_rng(1234)
     confidence = 0.9
     actual_accuracy = 0.6
-    logits = np.tile([0.0, np.log(confidence / (1 - confidence))], (num_samples, 1))
+    # Every sample shares one logit row; the calibrator only reads it.
+    logits = np.broadcast_to([0.0, np.log(confidence / (1 - confidence))], (num_samples, 2))
     labels = rng.binomial(1, actual_accuracy, size=num_samples)
     return logits, labels
 
 
 def make_isotonic_dataset():
     rng = np.random.default_rng(4321)
-    logits_parts = []
-    labels_parts = []
-
-    def group(prob, correct_prob, pred_class, n):
-        base = np.array([prob, 1 - prob])
-        if pred_class == 1:
-            distribution = np.array([1 - prob, prob])
-        else:
-            distribution = base
-        logits = np.log(distribution)
-        logits_parts.append(np.tile(logits, (n, 1)))
-        outcomes = rng.binomial(1, correct_prob, size=n)
-        if pred_class == 0:
-            labels = np.where(outcomes == 1, 0, 1)
-        else:
-            labels = np.where(outcomes == 1, 1, 0)
-        labels_parts.append(labels)
-
-    group(0.8, 0.55, pred_class=0, n=120)
-    group(0.85, 0.65, pred_class=1, n=80)
-
-    logits = np.vstack(logits_parts)
-    labels = np.concatenate(labels_parts)
+    # Two groups: 120 samples predicting class 0 with p=0.8 (55% correct) and
+    # 80 samples predicting class 1 with p=0.85 (65% correct).
+    sizes = [120, 80]
+    group_logits = np.log([[0.8, 1 - 0.8], [1 - 0.85, 0.85]])
+    correct_prob = [0.55, 0.65]
+    pred_class = np.array([0, 1])
+
+    logits = np.repeat(group_logits, sizes, axis=0)
+    # One draw covers both groups; element-wise probabilities consume the
+    # generator in the same order as one call per group.
+    outcomes = rng.binomial(1, np.repeat(correct_prob, sizes))
+    # A correct outcome keeps the predicted class, an incorrect one flips it.
+    labels = outcomes ^ np.repeat(1 - pred_class, sizes)
     return logits, labels
 
 
-def test_temperature_calibration_meets_threshold(tmp_path):
-    calibrator = ClipCalibrator(config_path=CONFIG_PATH, artifact_root=tmp_path)
+@pytest.fixture(name="uncalibrated_ece", scope="module")
+def fixture_uncalibrated_ece(calibration_config, tmp_path_factory):
+    """ECE of the raw softmax for each seeded dataset, computed once per module."""
+    calibrator = ClipCalibrator(
+        config=calibration_config, artifact_root=tmp_path_factory.mktemp("ece-baseline")
+    )
+    eces = {}
+    for name, (logits, labels) in (
+        ("temperature", make_temperature_dataset()),
+        ("isotonic", make_isotonic_dataset()),
+    ):
+        eces[name] = calibrator.compute_ece(calibrator.softmax(logits), labels)
+    return eces
+
+
+def test_temperature_calibration_meets_threshold(tmp_path, calibration_config, uncalibrated_ece):
+    calibrator = ClipCalibrator(config=calibration_config, artifact_root=tmp_path)
     logits, labels = make_temperature_dataset()
-    base_probs = calibrator.softmax(logits)
-    ece_before = calibrator.compute_ece(base_probs, labels)
 
     result = calibrator.calibrate(logits, labels, method="temperature")
-    tau_expected = np.log(0.9 / 0.1) / np.log(0.6 / 0.4)
 
-    assert result.tau == pytest.approx(tau_expected, rel=0.35)
+    assert result.tau == pytest.approx(TAU_EXPECTED, rel=0.35)
     assert result.ece <= 0.05
-    assert result.ece < ece_before
+    assert result.ece < uncalibrated_ece["temperature"]
     assert Path(result.artifact).exists()
 
     with Path(result.artifact).open("r", encoding="utf-8") as fh:
@@ -72,12 +86,12 @@ def test_temperature_calibration_meets_threshold(tmp_path):
     assert payload["tau"] == pytest.approx(result.tau)
 
 
-def test_temperature_artifact_reuse(tmp_path):
-    calibrator_first = ClipCalibrator(config_path=CONFIG_PATH, artifact_root=tmp_path)
+def test_temperature_artifact_reuse(tmp_path, calibration_config):
+    calibrator_first = ClipCalibrator(config=calibration_config, artifact_root=tmp_path)
     logits, labels = make_temperature_dataset()
     first = calibrator_first.calibrate(logits, labels, method="temperature")
 
-    calibrator_second = ClipCalibrator(config_path=CONFIG_PATH, artifact_root=tmp_path)
+    calibrator_second = ClipCalibrator(config=calibration_config, artifact_root=tmp_path)
     with mock.patch.object(
         calibrator_second, "_fit_temperature_scaling", side_effect=AssertionError("should not refit")
     ):
@@ -86,16 +100,14 @@ def test_temperature_artifact_reuse(tmp_path):
     assert reused.ece == pytest.approx(first.ece)
 
 
-def test_isotonic_calibration_reduces_ece(tmp_path):
-    calibrator = ClipCalibrator(config_path=CONFIG_PATH, artifact_root=tmp_path)
+def test_isotonic_calibration_reduces_ece(tmp_path, calibration_config, uncalibrated_ece):
+    calibrator = ClipCalibrator(config=calibration_config, artifact_root=tmp_path)
     logits, labels = make_isotonic_dataset()
-    base_probs = calibrator.softmax(logits)
-    ece_before = calibrator.compute_ece(base_probs, labels)
 
     result = calibrator.calibrate(logits, labels, method="isotonic")
 
     assert result.ece <= 0.05
-    assert result.ece < ece_before
+    assert result.ece < uncalibrated_ece["isotonic"]
     assert result.tau is None
 
     artifacts = list(tmp_path.glob("*.json"))
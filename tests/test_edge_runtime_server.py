@@ -2,19 +2,25 @@
 
 import base64
 import io
+import struct
 import sys
 import types
-from importlib import import_module, reload
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
 
 import numpy as np
 import pytest
-import soundfile as sf
 from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
 from starlette.testclient import WebSocketTestSession
 from PIL import Image
 
+# Each test stubs ``sys.modules`` through monkeypatch and resets the metrics
+# registry in ``edge_app``, and xdist workers are separate processes with their
+# own server cache, so the tests can run on any worker in any order.
+pytestmark = pytest.mark.xdist_spread
+
 
 class FakeSmartGlassAgent:
     """Lightweight stand-in that avoids loading heavy models."""
@@ -63,31 +69,49 @@ class FakeSmartGlassAgent:
         return True
 
 
-def _encode_silent_wav(duration_seconds: float = 0.1, sample_rate: int = 16000) -> str:
-    samples = int(duration_seconds * sample_rate)
-    audio_array = np.zeros(samples, dtype=np.float32)
-    buffer = io.BytesIO()
-    sf.write(buffer, audio_array, sample_rate, format="WAV")
-    return base64.b64encode(buffer.getvalue()).decode()
-
-
+@lru_cache(maxsize=32)
 def _make_silent_wav_bytes(duration_seconds: float = 0.1, sample_rate: int = 16000) -> bytes:
     """Convenience helper for creating raw WAV payloads for WebSocket tests."""
 
-    return base64.b64decode(_encode_silent_wav(duration_seconds, sample_rate))
+    # Silent mono 16-bit PCM: a 44-byte RIFF header followed by zeroed samples.
+    data_len = int(duration_seconds * sample_rate) * 2
+    return (
+        b"RIFF"
+        + struct.pack("<I", 36 + data_len)
+        + b"WAVEfmt "
+        + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16)
+        + b"data"
+        + struct.pack("<I", data_len)
+        + bytes(data_len)
+    )
+
 
+@lru_cache(maxsize=32)
+def _encode_silent_wav(duration_seconds: float = 0.1, sample_rate: int = 16000) -> str:
+    return base64.b64encode(_make_silent_wav_bytes(duration_seconds, sample_rate)).decode()
 
+
+@lru_cache(maxsize=32)
 def _encode_test_image(size: int = 8, color: tuple[int, int, int] = (255, 0, 0)) -> str:
+    # Solid-color images are fully determined by the arguments; cache the
+    # encoded string so repeated frames skip the image encoder.
     image = Image.new("RGB", (size, size), color=color)
     buffer = io.BytesIO()
     image.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode()
+    return base64.b64encode(buffer.getbuffer()).decode()
 
 
+@lru_cache(maxsize=32)
 def _make_test_image_bytes(size: int = 8, color: tuple[int, int, int] = (255, 0, 0)) -> bytes:
     return base64.b64decode(_encode_test_image(size, color=color))
 
 
+# Server modules imported per distinct auth/env configuration. The server reads
+# its configuration at import time, so each configuration needs its own module
+# object; tests sharing a configuration reuse it instead of reloading.
+_SERVER_CACHE: dict[tuple, types.ModuleType] = {}
+
+
 @pytest.fixture(name="edge_app")
 def fixture_edge_app(monkeypatch, request):
     # Patch the SmartGlassAgent used by the session manager before importing the server.
@@ -150,11 +174,22 @@ def fixture_edge_app(monkeypatch, request):
     session_manager_module = import_module("src.edge_runtime.session_manager")
     monkeypatch.setattr(session_manager_module, "SmartGlassAgent", FakeSmartGlassAgent)
 
-    server_module = import_module("src.edge_runtime.server")
-    reload(server_module)
+    cache_key = (token, header_name, tuple(sorted(extra_env.items())))
+    server_module = _SERVER_CACHE.get(cache_key)
+    if server_module is None:
+        monkeypatch.delitem(sys.modules, "src.edge_runtime.server", raising=False)
+        server_module = import_module("src.edge_runtime.server")
+        _SERVER_CACHE[cache_key] = server_module
+    else:
+        monkeypatch.setitem(sys.modules, "src.edge_runtime.server", server_module)
+        # Drop sessions left behind by earlier tests on this configuration.
+        for summary in server_module.session_manager.list_sessions():
+            server_module.session_manager.delete_session(summary["session_id"])
+
     metrics_module = import_module("src.utils.metrics")
     metrics_module.metrics.reset()
     app = server_module.app
+    app.dependency_overrides.clear()
 
     if override_dependency:
         def _override_verify(request=None) -> None:  # type: ignore[annotation-unchecked]
@@ -164,133 +199,137 @@ def fixture_edge_app(monkeypatch, request):
     return app
 
 
-def test_edge_runtime_server_lifecycle(edge_app):
-    client = TestClient(edge_app)
-
-    create_response = client.post("/sessions")
-    assert create_response.status_code == 200
-    session_id = create_response.json()["session_id"]
-
-    audio_payload = {"audio_base64": _encode_silent_wav(), "language": "en"}
-    audio_response = client.post(f"/sessions/{session_id}/audio", json=audio_payload)
-    assert audio_response.status_code == 200
-    assert audio_response.json()["transcript"] == "stub-transcript"
+def _create_session(client: TestClient, headers: dict[str, str] | None = None) -> str:
+    """Create a session through ``client`` and return its id."""
 
-    frame_payload = {"image_base64": _encode_test_image()}
-    frame_response = client.post(f"/sessions/{session_id}/frame", json=frame_payload)
-    assert frame_response.status_code == 200
-    assert frame_response.json()["status"] == "frame stored"
+    response = client.post("/sessions", headers=headers)
+    assert response.status_code == 200
+    return response.json()["session_id"]
 
-    query_payload = {"text_query": "What do you see?"}
-    query_response = client.post(f"/sessions/{session_id}/query", json=query_payload)
-    assert query_response.status_code == 200
-    result = query_response.json()
-    assert result["transcript"] == "What do you see?"
-    assert result["response"] == "stub-response"
-    assert isinstance(result["overlays"], list)
 
-    delete_response = client.delete(f"/sessions/{session_id}")
-    assert delete_response.status_code == 200
-    assert delete_response.json()["status"] == "deleted"
+def test_edge_runtime_server_lifecycle(edge_app):
+    with TestClient(edge_app) as client:
+        create_response = client.post("/sessions")
+        assert create_response.status_code == 200
+        session_id = create_response.json()["session_id"]
+
+        audio_payload = {"audio_base64": _encode_silent_wav(), "language": "en"}
+        audio_response = client.post(f"/sessions/{session_id}/audio", json=audio_payload)
+        assert audio_response.status_code == 200
+        assert audio_response.json()["transcript"] == "stub-transcript"
+
+        frame_payload = {"image_base64": _encode_test_image()}
+        frame_response = client.post(f"/sessions/{session_id}/frame", json=frame_payload)
+        assert frame_response.status_code == 200
+        assert frame_response.json()["status"] == "frame stored"
+
+        query_payload = {"text_query": "What do you see?"}
+        query_response = client.post(f"/sessions/{session_id}/query", json=query_payload)
+        assert query_response.status_code == 200
+        result = query_response.json()
+        assert result["transcript"] == "What do you see?"
+        assert result["response"] == "stub-response"
+        assert isinstance(result["overlays"], list)
+
+        delete_response = client.delete(f"/sessions/{session_id}")
+        assert delete_response.status_code == 200
+        assert delete_response.json()["status"] == "deleted"
 
 
 def test_list_sessions_endpoint(edge_app):
-    client = TestClient(edge_app)
-    
-    # Initially, no sessions should exist
-    list_response = client.get("/sessions")
-    assert list_response.status_code == 200
-    assert list_response.json()["count"] == 0
-    assert list_response.json()["sessions"] == []
-    
-    # Create first session
-    session1_id = client.post("/sessions").json()["session_id"]
-    
-    # List should show one session
-    list_response = client.get("/sessions")
-    assert list_response.status_code == 200
-    assert list_response.json()["count"] == 1
-    sessions = list_response.json()["sessions"]
-    assert len(sessions) == 1
-    assert sessions[0]["session_id"] == session1_id
-    assert sessions[0]["transcript_count"] == 0
-    assert sessions[0]["has_frame"] is False
-    assert sessions[0]["query_count"] == 0
-    
-    # Create second session with some activity
-    session2_id = client.post("/sessions").json()["session_id"]
-    audio_payload = {"audio_base64": _encode_silent_wav(), "language": "en"}
-    client.post(f"/sessions/{session2_id}/audio", json=audio_payload)
-    frame_payload = {"image_base64": _encode_test_image()}
-    client.post(f"/sessions/{session2_id}/frame", json=frame_payload)
-    client.post(f"/sessions/{session2_id}/query", json={"text_query": "test"})
-    
-    # List should show two sessions with different states
-    list_response = client.get("/sessions")
-    assert list_response.status_code == 200
-    assert list_response.json()["count"] == 2
-    sessions = list_response.json()["sessions"]
-    assert len(sessions) == 2
-    
-    # Find session2 in the list and verify its state
-    session2_data = next(s for s in sessions if s["session_id"] == session2_id)
-    assert session2_data["transcript_count"] > 0
-    assert session2_data["has_frame"] is True
-    assert session2_data["query_count"] > 0
-    
-    # Delete first session
-    client.delete(f"/sessions/{session1_id}")
-    
-    # List should show only one session now
-    list_response = client.get("/sessions")
-    assert list_response.status_code == 200
-    assert list_response.json()["count"] == 1
-    assert list_response.json()["sessions"][0]["session_id"] == session2_id
-    
-    # Delete second session
-    client.delete(f"/sessions/{session2_id}")
-    
-    # List should be empty again
-    list_response = client.get("/sessions")
-    assert list_response.status_code == 200
-    assert list_response.json()["count"] == 0
+    with TestClient(edge_app) as client:
+        # Initially, no sessions should exist
+        list_response = client.get("/sessions")
+        assert list_response.status_code == 200
+        assert list_response.json()["count"] == 0
+        assert list_response.json()["sessions"] == []
+
+        # Create first session
+        session1_id = client.post("/sessions").json()["session_id"]
+
+        # List should show one session
+        list_response = client.get("/sessions")
+        assert list_response.status_code == 200
+        assert list_response.json()["count"] == 1
+        sessions = list_response.json()["sessions"]
+        assert len(sessions) == 1
+        assert sessions[0]["session_id"] == session1_id
+        assert sessions[0]["transcript_count"] == 0
+        assert sessions[0]["has_frame"] is False
+        assert sessions[0]["query_count"] == 0
+
+        # Create second session with some activity
+        session2_id = client.post("/sessions").json()["session_id"]
+        audio_payload = {"audio_base64": _encode_silent_wav(), "language": "en"}
+        client.post(f"/sessions/{session2_id}/audio", json=audio_payload)
+        frame_payload = {"image_base64": _encode_test_image()}
+        client.post(f"/sessions/{session2_id}/frame", json=frame_payload)
+        client.post(f"/sessions/{session2_id}/query", json={"text_query": "test"})
+
+        # List should show two sessions with different states
+        list_response = client.get("/sessions")
+        assert list_response.status_code == 200
+        assert list_response.json()["count"] == 2
+        sessions = list_response.json()["sessions"]
+        assert len(sessions) == 2
+
+        # Find session2 in the list and verify its state
+        session2_data = next(s for s in sessions if s["session_id"] == session2_id)
+        assert session2_data["transcript_count"] > 0
+        assert session2_data["has_frame"] is True
+        assert session2_data["query_count"] > 0
+
+        # Delete first session
+        client.delete(f"/sessions/{session1_id}")
+
+        # List should show only one session now
+        list_response = client.get("/sessions")
+        assert list_response.status_code == 200
+        assert list_response.json()["count"] == 1
+        assert list_response.json()["sessions"][0]["session_id"] == session2_id
+
+        # Delete second session
+        client.delete(f"/sessions/{session2_id}")
+
+        # List should be empty again
+        list_response = client.get("/sessions")
+        assert list_response.status_code == 200
+        assert list_response.json()["count"] == 0
 
 
 def test_metrics_endpoint_reports_activity(edge_app):
-    client = TestClient(edge_app)
-
-    session_id = client.post("/sessions").json()["session_id"]
-    audio_payload = {"audio_base64": _encode_silent_wav(), "language": "en"}
-    client.post(f"/sessions/{session_id}/audio", json=audio_payload)
-    client.post(f"/sessions/{session_id}/query", json={"text_query": "ping"})
-
-    response = client.get("/metrics")
-    assert response.status_code == 200
-    payload = response.json()
-    assert payload["sessions"]["created"] >= 1
-    assert payload["queries"]["total"] >= 1
-    assert payload["latencies"]["ASR"]["count"] >= 1
-    assert payload["latencies"]["LLM"]["count"] >= 1
-    assert payload["display_available"] is True
+    with TestClient(edge_app) as client:
+        session_id = client.post("/sessions").json()["session_id"]
+        audio_payload = {"audio_base64": _encode_silent_wav(), "language": "en"}
+        client.post(f"/sessions/{session_id}/audio", json=audio_payload)
+        client.post(f"/sessions/{session_id}/query", json={"text_query": "ping"})
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["sessions"]["created"] >= 1
+        assert payload["queries"]["total"] >= 1
+        assert payload["latencies"]["ASR"]["count"] >= 1
+        assert payload["latencies"]["LLM"]["count"] >= 1
+        assert payload["display_available"] is True
 
 
 @pytest.mark.parametrize("edge_app", ["secret-key"], indirect=True)
 def test_edge_runtime_server_requires_api_key(edge_app):
-    client = TestClient(edge_app)
+    with TestClient(edge_app) as client:
+        missing_header_response = client.post("/sessions")
+        assert missing_header_response.status_code == 401
 
-    missing_header_response = client.post("/sessions")
-    assert missing_header_response.status_code == 401
+        wrong_header_response = client.post("/sessions", headers={"X-API-Key": "wrong"})
+        assert wrong_header_response.status_code == 401
 
-    wrong_header_response = client.post("/sessions", headers={"X-API-Key": "wrong"})
-    assert wrong_header_response.status_code == 401
+        headers = {"X-API-Key": "secret-key"}
+        create_response = client.post("/sessions", headers=headers)
+        assert create_response.status_code == 200
 
-    headers = {"X-API-Key": "secret-key"}
-    create_response = client.post("/sessions", headers=headers)
-    assert create_response.status_code == 200
-
-    session_id = create_response.json()["session_id"]
-    delete_response = client.delete(f"/sessions/{session_id}", headers=headers)
-    assert delete_response.status_code == 200
+        session_id = create_response.json()["session_id"]
+        delete_response = client.delete(f"/sessions/{session_id}", headers=headers)
+        assert delete_response.status_code == 200
 
 
 @pytest.mark.parametrize(
@@ -304,23 +343,22 @@ def test_edge_runtime_server_requires_api_key(edge_app):
     indirect=True,
 )
 def test_edge_runtime_server_supports_custom_auth_header(edge_app):
-    client = TestClient(edge_app)
-
-    missing_header_response = client.post("/sessions")
-    assert missing_header_response.status_code == 401
+    with TestClient(edge_app) as client:
+        missing_header_response = client.post("/sessions")
+        assert missing_header_response.status_code == 401
 
-    wrong_header_response = client.post(
-        "/sessions", headers={"Authorization": "Bearer wrong-token"}
-    )
-    assert wrong_header_response.status_code == 401
+        wrong_header_response = client.post(
+            "/sessions", headers={"Authorization": "Bearer wrong-token"}
+        )
+        assert wrong_header_response.status_code == 401
 
-    headers = {"Authorization": "Bearer bearer-token"}
-    create_response = client.post("/sessions", headers=headers)
-    assert create_response.status_code == 200
+        headers = {"Authorization": "Bearer bearer-token"}
+        create_response = client.post("/sessions", headers=headers)
+        assert create_response.status_code == 200
 
-    session_id = create_response.json()["session_id"]
-    delete_response = client.delete(f"/sessions/{session_id}", headers=headers)
-    assert delete_response.status_code == 200
+        session_id = create_response.json()["session_id"]
+        delete_response = client.delete(f"/sessions/{session_id}", headers=headers)
+        assert delete_response.status_code == 200
 
 
 @pytest.mark.parametrize(
@@ -336,14 +374,13 @@ def test_edge_runtime_server_supports_custom_auth_header(edge_app):
     indirect=True,
 )
 def test_audio_ingest_rejects_when_limits_exceeded(edge_app):
-    client = TestClient(edge_app)
+    with TestClient(edge_app) as client:
+        session_id = _create_session(client)
+        audio_payload = {"audio_base64": _encode_silent_wav(duration_seconds=0.1)}
+        response = client.post(f"/sessions/{session_id}/audio", json=audio_payload)
 
-    session_id = client.post("/sessions").json()["session_id"]
-    audio_payload = {"audio_base64": _encode_silent_wav(duration_seconds=0.1)}
-    response = client.post(f"/sessions/{session_id}/audio", json=audio_payload)
-
-    assert response.status_code == 413
-    assert "Audio payload exceeds configured maximum buffer duration" in response.json()["detail"]
+        assert response.status_code == 413
+        assert "Audio payload exceeds configured maximum buffer duration" in response.json()["detail"]
 
 
 @pytest.mark.parametrize(
@@ -359,16 +396,15 @@ def test_audio_ingest_rejects_when_limits_exceeded(edge_app):
     indirect=True,
 )
 def test_audio_ingest_trims_when_limits_exceeded(edge_app):
-    client = TestClient(edge_app)
-
-    session_id = client.post("/sessions").json()["session_id"]
-    audio_payload = {"audio_base64": _encode_silent_wav(duration_seconds=0.1)}
+    with TestClient(edge_app) as client:
+        session_id = _create_session(client)
+        audio_payload = {"audio_base64": _encode_silent_wav(duration_seconds=0.1)}
 
-    first = client.post(f"/sessions/{session_id}/audio", json=audio_payload)
-    second = client.post(f"/sessions/{session_id}/audio", json=audio_payload)
+        first = client.post(f"/sessions/{session_id}/audio", json=audio_payload)
+        second = client.post(f"/sessions/{session_id}/audio", json=audio_payload)
 
-    assert first.status_code == 200
-    assert second.status_code == 200
+        assert first.status_code == 200
+        assert second.status_code == 200
 
 
 @pytest.mark.parametrize(
@@ -385,35 +421,33 @@ def test_audio_ingest_trims_when_limits_exceeded(edge_app):
     indirect=True,
 )
 def test_frame_ingest_rejects_when_limits_exceeded(edge_app):
-    client = TestClient(edge_app)
+    with TestClient(edge_app) as client:
+        session_id = _create_session(client)
+        frame_payload = {"image_base64": _encode_test_image(size=8)}
 
-    session_id = client.post("/sessions").json()["session_id"]
-    frame_payload = {"image_base64": _encode_test_image(size=8)}
+        first = client.post(f"/sessions/{session_id}/frame", json=frame_payload)
+        second = client.post(f"/sessions/{session_id}/frame", json=frame_payload)
 
-    first = client.post(f"/sessions/{session_id}/frame", json=frame_payload)
-    second = client.post(f"/sessions/{session_id}/frame", json=frame_payload)
-
-    assert first.status_code == 200
-    assert second.status_code == 413
-    assert "Frame buffer would exceed configured limits" in second.json()["detail"]
+        assert first.status_code == 200
+        assert second.status_code == 413
+        assert "Frame buffer would exceed configured limits" in second.json()["detail"]
 
 
 def test_http_routes_reject_unknown_session_ids(edge_app):
-    client = TestClient(edge_app)
-
-    invalid_session = "does-not-exist"
-    audio_payload = {"audio_base64": _encode_silent_wav()}
-    frame_payload = {"image_base64": _encode_test_image()}
-    query_payload = {"text_query": "hello"}
+    with TestClient(edge_app) as client:
+        invalid_session = "does-not-exist"
+        audio_payload = {"audio_base64": _encode_silent_wav()}
+        frame_payload = {"image_base64": _encode_test_image()}
+        query_payload = {"text_query": "hello"}
 
-    audio_response = client.post(f"/sessions/{invalid_session}/audio", json=audio_payload)
-    frame_response = client.post(f"/sessions/{invalid_session}/frame", json=frame_payload)
-    query_response = client.post(f"/sessions/{invalid_session}/query", json=query_payload)
-    delete_response = client.delete(f"/sessions/{invalid_session}")
+        audio_response = client.post(f"/sessions/{invalid_session}/audio", json=audio_payload)
+        frame_response = client.post(f"/sessions/{invalid_session}/frame", json=frame_payload)
+        query_response = client.post(f"/sessions/{invalid_session}/query", json=query_payload)
+        delete_response = client.delete(f"/sessions/{invalid_session}")
 
-    for response in (audio_response, frame_response, query_response, delete_response):
-        assert response.status_code == 404
-        assert "Unknown session id" in response.json()["detail"]
+        for response in (audio_response, frame_response, query_response, delete_response):
+            assert response.status_code == 404
+            assert "Unknown session id" in response.json()["detail"]
 
 
 @pytest.mark.parametrize(
@@ -426,20 +460,20 @@ def test_http_routes_reject_unknown_session_ids(edge_app):
     indirect=True,
 )
 def test_websocket_routes_reject_unknown_session_ids(edge_app):
-    client = TestClient(edge_app)
-    missing_session = "missing"
+    with TestClient(edge_app) as client:
+        missing_session = "missing"
 
-    with pytest.raises(WebSocketDisconnect) as audio_exc:
-        with client.websocket_connect(f"/ws/audio/{missing_session}") as websocket:
-            websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect) as audio_exc:
+            with client.websocket_connect(f"/ws/audio/{missing_session}") as websocket:
+                websocket.receive_json()
 
-    assert audio_exc.value.code == 4404
+        assert audio_exc.value.code == 4404
 
-    with pytest.raises(WebSocketDisconnect) as frame_exc:
-        with client.websocket_connect(f"/ws/frame/{missing_session}") as websocket:
-            websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect) as frame_exc:
+            with client.websocket_connect(f"/ws/frame/{missing_session}") as websocket:
+                websocket.receive_json()
 
-    assert frame_exc.value.code == 4404
+        assert frame_exc.value.code == 4404
 
 
 @pytest.mark.parametrize(
@@ -450,20 +484,20 @@ def test_websocket_routes_reject_unknown_session_ids(edge_app):
     indirect=True,
 )
 def test_websocket_authentication_required(edge_app):
-    client = TestClient(edge_app)
-    session_id = client.post("/sessions", headers={"X-API-Key": "secret-key"}).json()["session_id"]
+    with TestClient(edge_app) as client:
+        session_id = _create_session(client, {"X-API-Key": "secret-key"})
 
-    with pytest.raises(WebSocketDisconnect) as audio_exc:
-        with client.websocket_connect(f"/ws/audio/{session_id}") as websocket:
-            websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect) as audio_exc:
+            with client.websocket_connect(f"/ws/audio/{session_id}") as websocket:
+                websocket.receive_json()
 
-    assert audio_exc.value.code == 4401
+        assert audio_exc.value.code == 4401
 
-    with pytest.raises(WebSocketDisconnect) as frame_exc:
-        with client.websocket_connect(f"/ws/frame/{session_id}") as websocket:
-            websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect) as frame_exc:
+            with client.websocket_connect(f"/ws/frame/{session_id}") as websocket:
+                websocket.receive_json()
 
-    assert frame_exc.value.code == 4401
+        assert frame_exc.value.code == 4401
 
 
 @pytest.mark.parametrize(
@@ -478,48 +512,50 @@ def test_websocket_authentication_required(edge_app):
     indirect=True,
 )
 def test_websocket_audio_streaming_and_limits(edge_app):
-    client = TestClient(edge_app)
-    headers = {"X-API-Key": "secret-token"}
-    session_id = client.post("/sessions", headers=headers).json()["session_id"]
+    with TestClient(edge_app) as client:
+        headers = {"X-API-Key": "secret-token"}
+        session_id = _create_session(client, headers)
 
-    with client.websocket_connect(f"/ws/audio/{session_id}", headers=headers) as websocket:
-        websocket: WebSocketTestSession
+        with client.websocket_connect(f"/ws/audio/{session_id}", headers=headers) as websocket:
+            websocket: WebSocketTestSession
 
-        websocket.send_bytes(_make_silent_wav_bytes(duration_seconds=0.005))
-        first = websocket.receive_json()
-        assert first["session_id"] == session_id
-        assert first["transcript"] == "stub-transcript"
+            websocket.send_bytes(_make_silent_wav_bytes(duration_seconds=0.005))
+            first = websocket.receive_json()
+            assert first["session_id"] == session_id
+            assert first["transcript"] == "stub-transcript"
 
-        websocket.send_bytes(_make_silent_wav_bytes(duration_seconds=0.05))
-        second = websocket.receive_json()
-        assert second["session_id"] == session_id
-        assert "Audio payload exceeds configured maximum buffer duration" in second["error"]
+            websocket.send_bytes(_make_silent_wav_bytes(duration_seconds=0.05))
+            second = websocket.receive_json()
+            assert second["session_id"] == session_id
+            assert "Audio payload exceeds configured maximum buffer duration" in second["error"]
 
-        with pytest.raises(WebSocketDisconnect) as excinfo:
-            websocket.receive_json()
+            with pytest.raises(WebSocketDisconnect) as excinfo:
+                websocket.receive_json()
 
-        assert excinfo.value.code == 1009
+            assert excinfo.value.code == 1009
 
 
 @pytest.mark.parametrize(
     "edge_app",
     [
-        {"token": "secret-token", "override_dependency": True},
+        # Same configuration as the WebSocket auth test, so the cached server
+        # module is shared rather than imported again.
+        {"token": "secret-key", "override_dependency": True},
     ],
     indirect=True,
 )
 def test_websocket_frame_streaming(edge_app):
-    client = TestClient(edge_app)
-    headers = {"X-API-Key": "secret-token"}
-    session_id = client.post("/sessions", headers=headers).json()["session_id"]
+    with TestClient(edge_app) as client:
+        headers = {"X-API-Key": "secret-key"}
+        session_id = _create_session(client, headers)
 
-    with client.websocket_connect(f"/ws/frame/{session_id}", headers=headers) as websocket:
-        websocket: WebSocketTestSession
+        with client.websocket_connect(f"/ws/frame/{session_id}", headers=headers) as websocket:
+            websocket: WebSocketTestSession
 
-        websocket.send_bytes(_make_test_image_bytes(size=4))
-        first = websocket.receive_json()
-        assert first == {"session_id": session_id, "status": "frame stored"}
+            websocket.send_bytes(_make_test_image_bytes(size=4))
+            first = websocket.receive_json()
+            assert first == {"session_id": session_id, "status": "frame stored"}
 
-        websocket.send_bytes(_make_test_image_bytes(size=4))
-        second = websocket.receive_json()
-        assert second == {"session_id": session_id, "status": "frame stored"}
+            websocket.send_bytes(_make_test_image_bytes(size=4))
+            second = websocket.receive_json()
+            assert second == {"session_id": session_id, "status": "frame stored"}
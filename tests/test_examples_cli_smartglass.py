@@ -4,6 +4,8 @@ import builtins
 import sys
 from types import ModuleType
 
+import pytest
+
 
 def _install_stub_modules() -> None:
     dummy_gpt2 = ModuleType("gpt2_generator")
@@ -19,6 +21,22 @@ def _install_stub_modules() -> None:
     sys.modules.setdefault("smartglass_agent", dummy_agent_module)
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _stub_modules() -> None:
+    # The stubs go in with sys.modules.setdefault, so installing them once
+    # before the first test covers the whole module.
+    _install_stub_modules()
+
+
+@pytest.fixture(scope="module")
+def cli_module(_stub_modules: None) -> ModuleType:
+    """Import the CLI example only after the stub modules are installed."""
+
+    import examples.cli_smartglass as cli_smartglass
+
+    return cli_smartglass
+
+
 class _DummyAgent:
     def __init__(self, calls: list[str]):
         self.calls = calls
@@ -29,23 +47,25 @@ class _DummyAgent:
         return {"response": "stub response", "actions": [{"type": "mock-action"}]}
 
 
-def test_cli_main_runs_with_mock(monkeypatch, capsys):
-    _install_stub_modules()
-
-    import examples.cli_smartglass as cli_smartglass
-
+def test_cli_main_runs_with_mock(monkeypatch, cli_module):
     calls: list[str] = []
+    printed: list[tuple[object, ...]] = []
+    pprinted: list[object] = []
 
     monkeypatch.setenv("PROVIDER", "mock")
-    monkeypatch.setattr(cli_smartglass, "initialize_agent", lambda backend: _DummyAgent(calls))
-    monkeypatch.setattr(cli_smartglass.sys, "argv", ["cli_smartglass"])
+    monkeypatch.setattr(cli_module, "initialize_agent", lambda backend: _DummyAgent(calls))
+    monkeypatch.setattr(cli_module.sys, "argv", ["cli_smartglass"])
+    # Record what the CLI emits instead of scanning captured stdout.
+    monkeypatch.setattr(
+        cli_module, "print", lambda *args, **kwargs: printed.append(args), raising=False
+    )
+    monkeypatch.setattr(cli_module, "pprint", pprinted.append)
 
     user_inputs = iter(["hello", ""])  # exit on second prompt
     monkeypatch.setattr(builtins, "input", lambda prompt="": next(user_inputs))
 
-    cli_smartglass.main()
-    captured = capsys.readouterr()
+    cli_module.main()
 
-    assert "stub response" in captured.out
-    assert "mock-action" in captured.out
+    assert ("Agent: stub response",) in printed
+    assert pprinted == [[{"type": "mock-action"}]]
     assert calls == ["initialized", ("hello", None)]
@@ -1,31 +1,30 @@
 from pathlib import Path
-import importlib.util
-import sys
 import json
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-MODULE_PATH = ROOT / "src" / "vision" / "route_runner.py"
-spec = importlib.util.spec_from_file_location("vision.route_runner", MODULE_PATH)
-module = importlib.util.module_from_spec(spec)
-assert spec and spec.loader
-sys.modules[spec.name] = module
-spec.loader.exec_module(module)
-ExplainThisRoute = module.ExplainThisRoute
+from tests._route_runner import load_route_runner
+
+ExplainThisRoute = load_route_runner().ExplainThisRoute
 
 
 FIXTURE_PATH = Path(__file__).resolve().parent / "fixtures" / "scenes" / "explain_fixtures.json"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def fixtures():
     with FIXTURE_PATH.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
-def test_top3_accuracy(fixtures):
-    runner = ExplainThisRoute()
+@pytest.fixture(scope="session")
+def runner():
+    # ``run`` re-resolves ``_min_conf`` from each fixture's context, so one
+    # route (with its parsed config and template) serves every test.
+    return ExplainThisRoute()
+
+
+def test_top3_accuracy(fixtures, runner):
     successes = 0
     for fixture in fixtures:
         result = runner.run(fixture)
@@ -35,8 +34,7 @@ def test_top3_accuracy(fixtures):
     assert accuracy >= 0.9, f"Expected >=0.9 top-3 accuracy, got {accuracy}"
 
 
-def test_response_word_budget_and_confidence(fixtures):
-    runner = ExplainThisRoute()
+def test_response_word_budget_and_confidence(fixtures, runner):
     for fixture in fixtures:
         result = runner.run(fixture)
         assert result.word_count <= 35, f"Response too long: {result.response}"
@@ -48,8 +46,7 @@ def test_response_word_budget_and_confidence(fixtures):
             assert "Confidence steady." in result.response
 
 
-def test_latency_logging(fixtures):
-    runner = ExplainThisRoute()
+def test_latency_logging(fixtures, runner):
     for fixture in fixtures:
         result = runner.run(fixture)
         latencies = result.latencies
@@ -68,8 +65,7 @@ def test_latency_logging(fixtures):
         ("scene_env_outdoor", 0.7, True),
     ],
 )
-def test_environment_specific_min_confidence(fixtures, fixture_id, expected_threshold, expects_tip):
-    runner = ExplainThisRoute()
+def test_environment_specific_min_confidence(fixtures, runner, fixture_id, expected_threshold, expects_tip):
     fixture = next(item for item in fixtures if item["id"] == fixture_id)
     result = runner.run(fixture)
     assert runner._min_conf == pytest.approx(expected_threshold)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -11,28 +12,45 @@ TEMPLATE_PATH = ROOT / "templates" / "short_hud.j2"
 HAPTICS_PATH = ROOT / "auditory" / "haptics.json"
 SUNLIT_FIXTURES_PATH = Path(__file__).resolve().parent / "fixtures" / "scenes" / "sunlit_contrast.json"
 
+_SLOT_RE = re.compile(r"\{\{\s*([\w\.]+)\s*\}\}")
+_WORD_RE = re.compile(r"\{\{\s*[\w\.]+\s*\}\}|[A-Za-z0-9_=\.]+")
+
 
 def _count_words(text: str) -> int:
-    tokens = re.findall(r"\{\{\s*[\w\.]+\s*\}\}|[A-Za-z0-9_=\.]+", text)
+    tokens = _WORD_RE.findall(text)
     return len(tokens)
 
 
+@lru_cache(maxsize=None)
+def _compile_template(text: str) -> tuple[str, tuple[str, ...]]:
+    """Turn ``{{ key }}`` slots into positional ``str.format`` fields.
+
+    Positional fields keep dotted slot names as plain context keys rather than
+    attribute lookups; literal braces are escaped for ``str.format``.
+    """
+
+    # split() alternates literal text with the captured slot names.
+    parts = _SLOT_RE.split(text)
+    literals = [part.replace("{", "{{").replace("}", "}}") for part in parts[::2]]
+    keys = tuple(parts[1::2])
+    fields = [f"{{{index}}}" for index in range(len(keys))] + [""]
+    return "".join(literal + field for literal, field in zip(literals, fields)), keys
+
+
 def _render_template(text: str, context: dict[str, object]) -> str:
-    def repl(match: re.Match[str]) -> str:
-        key = match.group(1)
+    fmt, keys = _compile_template(text)
+    for key in keys:
         if key not in context:
             raise KeyError(f"Missing key '{key}' for template rendering")
-        return str(context[key])
-
-    return re.sub(r"\{\{\s*([\w\.]+)\s*\}\}", repl, text)
+    return fmt.format(*[str(context[key]) for key in keys])
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def template_text() -> str:
     return TEMPLATE_PATH.read_text(encoding="utf-8").strip()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sunlit_contrast_fixtures() -> list[dict[str, object]]:
     with SUNLIT_FIXTURES_PATH.open("r", encoding="utf-8") as handle:
         fixtures = json.load(handle)
@@ -40,7 +58,7 @@ def sunlit_contrast_fixtures() -> list[dict[str, object]]:
     return fixtures
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def haptic_map() -> dict[str, list[int]]:
     with HAPTICS_PATH.open("r", encoding="utf-8") as handle:
         data = json.load(handle)
@@ -78,14 +96,20 @@ def test_haptic_sequences_cover_sunlit_cases(
     }
     assert required_events.issubset(haptic_map.keys())
 
+    # Reduce each pattern to its extremes once; they serve both the monotone
+    # check and the cross-event comparisons below.
+    shortest: dict[str, int] = {}
+    longest: dict[str, int] = {}
     for event, pattern in haptic_map.items():
         assert isinstance(pattern, list) and pattern, f"Missing pattern for {event}"
         assert all(isinstance(step, int) and step > 0 for step in pattern)
         assert len(pattern) % 2 == 1, "Patterns should end with a final hold duration"
-        assert len(set(pattern)) > 1, "Patterns should not be monotone pulses"
+        shortest[event] = min(pattern)
+        longest[event] = max(pattern)
+        assert shortest[event] != longest[event], "Patterns should not be monotone pulses"
 
-    assert max(haptic_map["obstacle_warning"]) > max(haptic_map["low_confidence"])
-    assert min(haptic_map["ambient_adjust"]) < min(haptic_map["goal_reached"])
+    assert longest["obstacle_warning"] > longest["low_confidence"]
+    assert shortest["ambient_adjust"] < shortest["goal_reached"]
 
     for fixture in sunlit_contrast_fixtures:
         assert fixture["haptic"] in haptic_map
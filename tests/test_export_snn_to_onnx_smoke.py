@@ -1,47 +1,58 @@
 import json
-import subprocess
 import sys
 from pathlib import Path
 
 import onnx
+import pytest
 import torch
 
+from scripts.export_snn_to_onnx import main as export_main
 from scripts.train_snn_student import SpikingStudentLM
 
+VOCAB_SIZE = 8
 
 
-def test_export_snn_to_onnx_smoke(tmp_path: Path) -> None:
-    """Build a minimal model, export to ONNX, and verify it loads."""
+@pytest.fixture(scope="session")
+def student_state_dict_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Save a minimal student's state dict once for every export test."""
 
-    vocab_size = 8
+    model_path = tmp_path_factory.mktemp("snn") / "student.pt"
+    torch.save(SpikingStudentLM(vocab_size=VOCAB_SIZE).state_dict(), model_path)
+    return model_path
 
-    model = SpikingStudentLM(vocab_size=vocab_size)
-    model_path = tmp_path / "student.pt"
-    torch.save(model.state_dict(), model_path)
 
-    metadata = {"vocab_size": vocab_size}
-    metadata_path = tmp_path / "metadata.json"
-    metadata_path.write_text(json.dumps(metadata))
+@pytest.fixture(scope="session")
+def onnx_artifact(tmp_path_factory: pytest.TempPathFactory, student_state_dict_path: Path) -> Path:
+    """Export the saved minimal model to ONNX once and return the file path."""
 
-    repo_root = Path(__file__).resolve().parents[1]
-    onnx_path = tmp_path / "student.onnx"
+    base = tmp_path_factory.mktemp("snn_onnx")
+    metadata_path = base / "metadata.json"
+    metadata_path.write_text(json.dumps({"vocab_size": VOCAB_SIZE}))
+    onnx_path = base / "student.onnx"
 
-    subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "scripts.export_snn_to_onnx",
-            "--model-path",
-            str(model_path),
-            "--metadata-path",
-            str(metadata_path),
-            "--output-path",
-            str(onnx_path),
-        ],
-        check=True,
-        cwd=repo_root,
-    )
+    # Run the exporter in-process; torch is already imported here, so this
+    # skips the interpreter start-up and imports of a subprocess.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "export_snn_to_onnx",
+                "--model-path",
+                str(student_state_dict_path),
+                "--metadata-path",
+                str(metadata_path),
+                "--output-path",
+                str(onnx_path),
+            ],
+        )
+        export_main()
+    return onnx_path
 
-    assert onnx_path.exists(), "ONNX export did not produce a file"
-    onnx_model = onnx.load(str(onnx_path))
+
+def test_export_snn_to_onnx_smoke(onnx_artifact: Path) -> None:
+    """Verify the exported minimal model exists and loads."""
+
+    assert onnx_artifact.exists(), "ONNX export did not produce a file"
+    onnx_model = onnx.load(str(onnx_artifact))
     assert onnx_model is not None
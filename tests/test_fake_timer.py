@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import List
+
+from tests._fake_timer import FakeTimer, FakeTimerHandle
+
+
+def _schedule(timer: FakeTimer, fired: List[int], delays: List[float]) -> List[FakeTimerHandle]:
+    return [
+        timer.call_later(delay, lambda idx=idx: fired.append(idx)) for idx, delay in enumerate(delays)
+    ]
+
+
+def test_cancelled_handles_are_compacted_past_half_the_queue() -> None:
+    timer = FakeTimer()
+    fired: List[int] = []
+    handles = _schedule(timer, fired, [1.0, 2.0, 3.0, 4.0])
+
+    handles[0].cancel()
+    handles[1].cancel()
+    assert timer._cancelled_count == 2
+    assert len(timer._queue) == 4
+
+    handles[2].cancel()
+    assert timer._cancelled_count == 0
+    assert [entry[2] for entry in timer._queue] == [handles[3]]
+
+    timer.advance(5.0)
+    assert fired == [3]
+
+
+def test_popping_a_cancelled_handle_releases_its_count() -> None:
+    timer = FakeTimer()
+    fired: List[int] = []
+    handles = _schedule(timer, fired, [1.0, 2.0, 3.0, 4.0])
+
+    handles[0].cancel()
+    handles[0].cancel()
+    assert timer._cancelled_count == 1
+
+    timer.advance(1.0)
+    assert timer._cancelled_count == 0
+    assert len(timer._queue) == 3
+    assert fired == []
+
+
+def test_burst_of_due_timers_fires_in_deadline_order() -> None:
+    timer = FakeTimer()
+    fired: List[int] = []
+    delays = [3.0, 1.0, 2.0, 1.0, 5.0, 0.5, 2.0, 4.0, 1.5, 3.0, 0.5, 2.5, 9.0]
+    _schedule(timer, fired, delays)
+
+    timer.advance(5.0)
+
+    due = sorted((delay, idx) for idx, delay in enumerate(delays) if delay <= 5.0)
+    assert fired == [idx for _, idx in due]
+    assert [entry[0] for entry in timer._queue] == [9.0]
+
+
+def test_callback_cancelling_a_later_handle_in_the_batch() -> None:
+    timer = FakeTimer()
+    fired: List[int] = []
+    handles = _schedule(timer, fired, [float(idx + 1) for idx in range(12)])
+
+    def cancel_later() -> None:
+        handles[4].cancel()
+        handles[10].cancel()
+
+    timer.call_later(0.5, cancel_later)
+    timer.advance(12.0)
+
+    assert fired == [idx for idx in range(12) if idx not in (4, 10)]
+    assert timer._cancelled_count == 0
+    assert timer._queue == []
+
+
+def test_callback_scheduling_an_already_due_timer_fires_it() -> None:
+    timer = FakeTimer()
+    fired: List[str] = []
+
+    def reschedule() -> None:
+        fired.append("first")
+        timer.call_later(0.0, lambda: fired.append("due"))
+        timer.call_later(5.0, lambda: fired.append("later"))
+
+    timer.call_later(1.0, reschedule)
+    for _ in range(10):
+        timer.call_later(1.5, lambda: fired.append("burst"))
+
+    timer.advance(2.0)
+
+    assert fired == ["first"] + ["burst"] * 10 + ["due"]
+    assert [entry[0] for entry in timer._queue] == [7.0]
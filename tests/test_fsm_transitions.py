@@ -1,36 +1,4 @@
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
-from policy.fsm import Event, FSMRouter, State
-
-
-def build_router() -> FSMRouter:
-    states = [
-        State("IDLE"),
-        State("PERCEIVE"),
-        State("FUSE"),
-        State("CAPTION"),
-        State("SPEAK", irreversible=True),
-        State("CONFIRM"),
-    ]
-    events = [
-        Event("WAKE", "IDLE", "PERCEIVE"),
-        Event("FRAME", "PERCEIVE", "FUSE"),
-        Event("FUSED", "FUSE", "CAPTION"),
-        Event("CAPTION_READY", "CAPTION", "CONFIRM"),
-        Event("CONFIRM_YES", "CONFIRM", "SPEAK"),
-        Event("CONFIRM_NO", "CONFIRM", "CAPTION"),
-        Event("CANCEL", ("PERCEIVE", "FUSE", "CAPTION", "CONFIRM", "SPEAK"), "IDLE"),
-        Event("TIMEOUT", "CONFIRM", "IDLE"),
-        Event("SPEAK_DONE", "SPEAK", "IDLE"),
-    ]
-    return FSMRouter(states, events, initial_state="IDLE")
-
-
-def test_golden_path_transitions():
-    router = build_router()
+def test_golden_path_transitions(router):
     entered_payloads = {}
 
     def record_payload(prev, cur, event, payload):
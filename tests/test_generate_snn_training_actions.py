@@ -13,6 +13,8 @@ import tempfile
 from pathlib import Path
 from types import ModuleType
 
+import pytest
+
 
 def _install_stub_modules() -> None:
     """Install stub modules for testing without full dependencies."""
@@ -96,10 +98,15 @@ def _install_stub_modules() -> None:
     sys.modules.setdefault("llm_snn_backend", dummy_snn)
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _stub_modules() -> None:
+    """Stub numpy, PIL and the agent backends before the script is imported."""
+
+    _install_stub_modules()
+
+
 def test_generate_scenarios():
     """Test that scenario generation works correctly."""
-    _install_stub_modules()
-    
     # Import after stubs are installed
     from examples.generate_snn_training_actions import generate_scenarios
     
@@ -123,8 +130,6 @@ def test_generate_scenarios():
 
 def test_build_prompt_for_snn():
     """Test prompt building function."""
-    _install_stub_modules()
-    
     from examples.generate_snn_training_actions import build_prompt_for_snn
     
     prompt = build_prompt_for_snn("Is it safe?", "A busy road with cars")
@@ -138,8 +143,6 @@ def test_build_prompt_for_snn():
 
 def test_extract_expected_output():
     """Test expected output extraction."""
-    _install_stub_modules()
-    
     from examples.generate_snn_training_actions import extract_expected_output
     
     mock_result = {
@@ -169,8 +172,6 @@ def test_extract_expected_output():
 
 def test_jsonl_output_format():
     """Test that JSONL output has correct format."""
-    _install_stub_modules()
-    
     from examples.generate_snn_training_actions import (
         build_prompt_for_snn,
         extract_expected_output
@@ -221,8 +222,6 @@ def test_jsonl_output_format():
 
 def test_script_imports():
     """Test that the script can be imported without errors."""
-    _install_stub_modules()
-    
     # This should not raise any errors
     import examples.generate_snn_training_actions as script
     
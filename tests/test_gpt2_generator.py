@@ -4,63 +4,98 @@ import importlib
 import importlib.machinery
 import sys
 import types
-import warnings
+from functools import lru_cache
+
+import pytest
+
+# The legacy GPT-2 wrappers warn on every use; pytest scopes this filter to
+# each test here rather than leaving it in the process-wide warning filters.
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
 
 
 def reload_gpt2_generator(monkeypatch):
+    # Dropping the cached module is enough for import_module to execute it
+    # afresh against the current stubs; a reload on top would run it twice.
     sys.modules.pop("src.gpt2_generator", None)
-    return importlib.reload(importlib.import_module("src.gpt2_generator"))
+    return importlib.import_module("src.gpt2_generator")
 
 
-def stub_external_modules(monkeypatch):
-    monkeypatch.setitem(
-        sys.modules,
-        "whisper",
-        types.SimpleNamespace(
+def _torch_tensor(value, device=None):  # pragma: no cover - trivial stub
+    return value
+
+
+def _build_stub_modules() -> dict[str, object]:
+    pil_module = types.ModuleType("PIL")
+    pil_image = types.ModuleType("PIL.Image")
+    pil_image.Image = object
+    pil_module.Image = pil_image
+    return {
+        "whisper": types.SimpleNamespace(
             load_model=lambda *args, **kwargs: None,
             __spec__=importlib.machinery.ModuleSpec("whisper", loader=None),
         ),
-    )
-    monkeypatch.setitem(
-        sys.modules,
-        "soundfile",
-        types.SimpleNamespace(
+        "soundfile": types.SimpleNamespace(
             read=lambda *args, **kwargs: None,
             write=lambda *args, **kwargs: None,
             __spec__=importlib.machinery.ModuleSpec("soundfile", loader=None),
         ),
-    )
-    torch_stub = types.SimpleNamespace(
-        cuda=types.SimpleNamespace(is_available=lambda: False),
-        __spec__=importlib.machinery.ModuleSpec("torch", loader=None),
-    )
-
-    def _tensor(value, device=None):  # pragma: no cover - trivial stub
-        return value
-
-    torch_stub.tensor = _tensor
-    monkeypatch.setitem(sys.modules, "torch", torch_stub)
-    monkeypatch.setitem(
-        sys.modules,
-        "numpy",
-        types.SimpleNamespace(
+        "torch": types.SimpleNamespace(
+            cuda=types.SimpleNamespace(is_available=lambda: False),
+            tensor=_torch_tensor,
+            __spec__=importlib.machinery.ModuleSpec("torch", loader=None),
+        ),
+        "numpy": types.SimpleNamespace(
             ndarray=object,
             array=lambda *args, **kwargs: None,
             __spec__=importlib.machinery.ModuleSpec("numpy", loader=None),
         ),
+        "PIL": pil_module,
+        "PIL.Image": pil_image,
+    }
+
+
+# The stubs carry no per-test state, so they are built once and only
+# (re)installed into sys.modules for each test.
+_STUB_MODULES = _build_stub_modules()
+
+
+def stub_external_modules(monkeypatch):
+    for name, module in _STUB_MODULES.items():
+        monkeypatch.setitem(sys.modules, name, module)
+
+
+def install_transformers_stub(monkeypatch, transformers_stub):
+    """Install ``transformers_stub`` and make ``find_spec`` report it.
+
+    Other lookups fall through to the real ``find_spec``, memoized per name
+    for the rest of the test so repeated probes during the import skip the
+    meta-path walk. The cache belongs to this test's patch and is discarded
+    with it.
+    """
+
+    monkeypatch.setitem(sys.modules, "transformers", transformers_stub)
+    original_find_spec = importlib.util.find_spec
+
+    @lru_cache(maxsize=256)
+    def cached_find_spec(name, package=None):
+        return original_find_spec(name, package)
+
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, package=None: transformers_stub.__spec__
+        if name == "transformers"
+        else cached_find_spec(name, package),
     )
-    pil_module = types.ModuleType("PIL")
-    pil_image = types.ModuleType("PIL.Image")
-    pil_image.Image = object
-    pil_module.Image = pil_image
-    monkeypatch.setitem(sys.modules, "PIL", pil_module)
-    monkeypatch.setitem(sys.modules, "PIL.Image", pil_image)
 
 
-def test_gpt2_generator_uses_stubbed_pipeline(monkeypatch):
-    warnings.filterwarnings("ignore", category=DeprecationWarning)
+@pytest.fixture(name="stubbed_env")
+def fixture_stubbed_env(monkeypatch):
     stub_external_modules(monkeypatch)
 
+
+@pytest.mark.usefixtures("stubbed_env")
+def test_gpt2_generator_uses_stubbed_pipeline(monkeypatch):
     outputs = [
         {"generated_text": "hello world"},
         {"generated_text": "second"},
@@ -112,15 +147,7 @@ def test_gpt2_generator_uses_stubbed_pipeline(monkeypatch):
         __spec__=importlib.machinery.ModuleSpec("transformers", loader=None),
     )
 
-    monkeypatch.setitem(sys.modules, "transformers", transformers_stub)
-    original_find_spec = importlib.util.find_spec
-    monkeypatch.setattr(
-        importlib.util,
-        "find_spec",
-        lambda name, *args, **kwargs: transformers_stub.__spec__
-        if name == "transformers"
-        else original_find_spec(name, *args, **kwargs),
-    )
+    install_transformers_stub(monkeypatch, transformers_stub)
     module = reload_gpt2_generator(monkeypatch)
 
     generator = module.GPT2TextGenerator()
@@ -130,10 +157,8 @@ def test_gpt2_generator_uses_stubbed_pipeline(monkeypatch):
     assert generator._backend.generate_tokens([0, 1, 2]) == [1, 2, 3]
 
 
+@pytest.mark.usefixtures("stubbed_env")
 def test_gpt2_generator_graceful_without_transformers(monkeypatch):
-    warnings.filterwarnings("ignore", category=DeprecationWarning)
-    stub_external_modules(monkeypatch)
-
     transformers_stub = types.SimpleNamespace(
         pipeline=None,
         AutoTokenizer=None,
@@ -143,15 +168,7 @@ def test_gpt2_generator_graceful_without_transformers(monkeypatch):
         __spec__=importlib.machinery.ModuleSpec("transformers", loader=None),
     )
 
-    monkeypatch.setitem(sys.modules, "transformers", transformers_stub)
-    original_find_spec = importlib.util.find_spec
-    monkeypatch.setattr(
-        importlib.util,
-        "find_spec",
-        lambda name, *args, **kwargs: transformers_stub.__spec__
-        if name == "transformers"
-        else original_find_spec(name, *args, **kwargs),
-    )
+    install_transformers_stub(monkeypatch, transformers_stub)
     module = reload_gpt2_generator(monkeypatch)
 
     generator = module.GPT2TextGenerator()
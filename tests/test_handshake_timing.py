@@ -1,100 +1,78 @@
 from __future__ import annotations
 
-import heapq
 from pathlib import Path
-from typing import Callable, List
+from typing import Tuple
 import sys
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from fsm import HandshakeBudgets, HandshakeFSM, HandshakeState, load_handshake_budgets
-
-
-class FakeTimerHandle:
-    def __init__(self, callback: Callable[[], None], deadline: float) -> None:
-        self._callback = callback
-        self.deadline = deadline
-        self.cancelled = False
-
-    def cancel(self) -> None:
-        self.cancelled = True
-
-    def __lt__(self, other: "FakeTimerHandle") -> bool:
-        return self.deadline < other.deadline
+from fsm import HandshakeBudgets, HandshakeFSM, HandshakeState
+from tests._fake_timer import FakeTimer
+from tests._handshake_budgets import BUDGETS
 
-    def fire(self) -> None:
-        if not self.cancelled:
-            self._callback()
 
+def _budget_epsilon(budgets: HandshakeBudgets) -> float:
+    """Return a step small enough to land inside both p50..p95 windows."""
 
-class FakeTimer:
-    def __init__(self) -> None:
-        self._now = 0.0
-        self._queue: List[FakeTimerHandle] = []
+    degrade_slack = max((budgets.degrade_p95 - budgets.degrade_p50) / 2, 1e-3)
+    reconnect_slack = max((budgets.reconnect_p95 - budgets.reconnect_p50) / 2, 1e-3)
+    epsilon = min(0.01, budgets.degrade_p50 / 4, budgets.reconnect_p50 / 4, degrade_slack, reconnect_slack)
+    if epsilon <= 0:
+        epsilon = 1e-3
+    return epsilon
 
-    def now(self) -> float:
-        return self._now
 
-    def call_later(self, delay: float, callback: Callable[[], None]) -> FakeTimerHandle:
-        handle = FakeTimerHandle(callback, self._now + delay)
-        heapq.heappush(self._queue, handle)
-        return handle
+# Derived from the shared budgets, so computed once for the module.
+EPSILON = _budget_epsilon(BUDGETS)
+PRE_DEGRADE = max(BUDGETS.degrade_p50 - EPSILON, 0.0)
+PRE_RECONNECT = max(BUDGETS.reconnect_p50 - EPSILON, 0.0)
 
-    def advance(self, delta: float) -> None:
-        self._now += delta
-        while self._queue and self._queue[0].deadline <= self._now:
-            handle = heapq.heappop(self._queue)
-            handle.fire()
 
+@pytest.fixture(name="handshake_env")
+def fixture_handshake_env() -> Tuple[HandshakeFSM, FakeTimer]:
+    """Return a fresh FSM on its own fake timer; the budgets are shared."""
 
-def load_budgets() -> HandshakeBudgets:
-    config_path = Path("config/ux_budgets.yaml")
-    return load_handshake_budgets(config_path)
+    timer = FakeTimer()
+    return HandshakeFSM(timer=timer, budgets=BUDGETS), timer
 
 
-def test_heartbeat_loss_triggers_degrade_and_reconnect_within_budgets() -> None:
-    budgets = load_budgets()
-    timer = FakeTimer()
-    fsm = HandshakeFSM(timer=timer, budgets=budgets)
+def test_heartbeat_loss_triggers_degrade_and_reconnect_within_budgets(
+    handshake_env: Tuple[HandshakeFSM, FakeTimer],
+) -> None:
+    fsm, timer = handshake_env
+    budgets = BUDGETS
 
     fsm.pair()
     assert fsm.state is HandshakeState.READY
 
-    degrade_slack = max((budgets.degrade_p95 - budgets.degrade_p50) / 2, 1e-3)
-    reconnect_slack = max((budgets.reconnect_p95 - budgets.reconnect_p50) / 2, 1e-3)
-    epsilon = min(0.01, budgets.degrade_p50 / 4, budgets.reconnect_p50 / 4, degrade_slack, reconnect_slack)
-    if epsilon <= 0:
-        epsilon = 1e-3
-    pre_degrade = max(budgets.degrade_p50 - epsilon, 0.0)
-    if pre_degrade:
-        timer.advance(pre_degrade)
+    if PRE_DEGRADE:
+        timer.advance(PRE_DEGRADE)
     assert fsm.state is HandshakeState.READY
 
-    timer.advance(2 * epsilon)
+    timer.advance(2 * EPSILON)
     assert fsm.state is HandshakeState.DEGRADED
     degrade_time = timer.now()
     assert budgets.degrade_p50 <= degrade_time <= budgets.degrade_p95
 
-    pre_reconnect = max(budgets.reconnect_p50 - epsilon, 0.0)
-    if pre_reconnect:
-        timer.advance(pre_reconnect)
+    if PRE_RECONNECT:
+        timer.advance(PRE_RECONNECT)
     assert fsm.state is HandshakeState.DEGRADED
 
-    timer.advance(2 * epsilon)
+    timer.advance(2 * EPSILON)
     assert fsm.state is HandshakeState.RECONNECTING
     reconnect_elapsed = timer.now() - degrade_time
     assert budgets.reconnect_p50 <= reconnect_elapsed <= budgets.reconnect_p95
 
 
-def test_heartbeat_resets_degrade_budget() -> None:
-    budgets = load_budgets()
-    timer = FakeTimer()
-    fsm = HandshakeFSM(timer=timer, budgets=budgets)
+def test_heartbeat_resets_degrade_budget(handshake_env: Tuple[HandshakeFSM, FakeTimer]) -> None:
+    fsm, timer = handshake_env
 
     fsm.pair()
-    half_window = budgets.degrade_p50 / 2
+    half_window = BUDGETS.degrade_p50 / 2
     timer.advance(half_window)
     fsm.heartbeat()
 
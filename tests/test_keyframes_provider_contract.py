@@ -1,10 +1,12 @@
-import numpy as np
+import pytest
+
+np = pytest.importorskip("numpy")
 
 from src.perception.vision_keyframe import frames_from_camera, select_keyframes
 
 
 class MockProvider:
-    def __init__(self, clip: np.ndarray):
+    def __init__(self, clip):
         self._clip = np.asarray(clip, dtype=np.float32)
 
     def camera(self, *, seconds: int = 1):
@@ -16,12 +18,10 @@ class MockProvider:
 def test_frames_from_camera_returns_grayscale_tensor():
     time_steps = 5
     height, width = 8, 12
-    clip = np.stack(
-        [
-            np.full((height, width, 3), fill_value=float(t), dtype=np.float32)
-            for t in range(time_steps)
-        ],
-        axis=0,
+    # Frame ``t`` is filled with ``t``; MockProvider copies the broadcast view.
+    clip = np.broadcast_to(
+        np.arange(time_steps, dtype=np.float32)[:, None, None, None],
+        (time_steps, height, width, 3),
     )
     provider = MockProvider(clip)
 
@@ -38,8 +38,8 @@ def test_select_keyframes_stable_from_provider_clip():
     time_steps = 12
     height, width = 16, 16
     clip = np.zeros((time_steps, height, width), dtype=np.float32)
-    for idx in range(time_steps):
-        clip[idx, idx % height] = idx
+    idxs = np.arange(time_steps)
+    clip[idxs, idxs % height] = idxs[:, None]
     provider = MockProvider(clip)
 
     frames_a = frames_from_camera(provider, seconds=1)
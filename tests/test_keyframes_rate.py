@@ -6,10 +6,15 @@ from src.perception import get_default_keyframer
 def _make_moving_square(num_frames: int = 30, size: int = 12, frame_size: int = 64) -> np.ndarray:
     frames = np.zeros((num_frames, frame_size, frame_size), dtype=np.float32)
     step = (frame_size - size) / (num_frames - 1)
-    for idx in range(num_frames):
-        top = int(round(idx * step))
-        left = int(round(idx * step / 2))
-        frames[idx, top : top + size, left : left + size] = 1.0
+    # np.rint rounds half to even, like round(), so the square positions are
+    # unchanged; one fancy-indexed write paints every frame's square.
+    idxs = np.arange(num_frames)
+    tops = np.rint(idxs * step).astype(np.intp)
+    lefts = np.rint(idxs * step / 2).astype(np.intp)
+    offsets = np.arange(size)
+    rows = tops[:, None] + offsets
+    cols = lefts[:, None] + offsets
+    frames[idxs[:, None, None], rows[:, :, None], cols[:, None, :]] = 1.0
     return frames
 
 
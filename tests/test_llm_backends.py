@@ -1,20 +1,11 @@
+import importlib
+import importlib.util
 import sys
 import types
 import warnings
 
 import pytest
 
-# Stub heavy dependencies so importing src does not require optional packages.
-stub_numpy = types.ModuleType("numpy")
-stub_numpy.ndarray = type("ndarray", (), {})
-sys.modules.setdefault("numpy", stub_numpy)
-
-stub_torch = types.ModuleType("torch")
-stub_torch.cuda = types.SimpleNamespace(is_available=lambda: False)
-sys.modules.setdefault("torch", stub_torch)
-
-stub_transformers = types.ModuleType("transformers")
-
 class _StubAutoTokenizer:
     pad_token = None
     eos_token = "</s>"
@@ -30,48 +21,83 @@ class _StubAutoTokenizer:
     def decode(self, token_ids):
         return " ".join(f"tok{token_id}" for token_id in token_ids)
 
-stub_transformers.AutoTokenizer = _StubAutoTokenizer
-stub_transformers.pipeline = lambda *args, **kwargs: None
-stub_transformers.CLIPProcessor = type("CLIPProcessor", (), {})
-stub_transformers.CLIPModel = type("CLIPModel", (), {})
-sys.modules.setdefault("transformers", stub_transformers)
-
-class _StubPillowImage:
-    Image = None
-
-_stub_image_class = type("Image", (), {})
-_StubPillowImage.Image = _stub_image_class
-
-stub_pil = types.ModuleType("PIL")
-stub_pil.Image = _StubPillowImage
-sys.modules.setdefault("PIL", stub_pil)
-
-for module_name in ("whisper", "soundfile"):
-    sys.modules.setdefault(module_name, types.ModuleType(module_name))
-
-from src.gpt2_generator import GPT2Backend
-from src.llm_snn_backend import SNNLLMBackend
-
-
-@pytest.mark.parametrize(
-    "backend_cls,kwargs",
-    [
-        (GPT2Backend, {}),
-        (
-            SNNLLMBackend,
-            {
-                "model_path": "artifacts/missing/student.pt",
-                "metadata_path": "artifacts/missing/metadata.json",
-            },
-        ),
-    ],
-)
-def test_llm_backends_generate_returns_text(backend_cls, kwargs):
+
+def _build_stub_modules() -> dict[str, types.ModuleType]:
+    stub_numpy = types.ModuleType("numpy")
+    stub_numpy.ndarray = type("ndarray", (), {})
+
+    stub_torch = types.ModuleType("torch")
+    stub_torch.cuda = types.SimpleNamespace(is_available=lambda: False)
+
+    stub_transformers = types.ModuleType("transformers")
+    stub_transformers.AutoTokenizer = _StubAutoTokenizer
+    stub_transformers.pipeline = lambda *args, **kwargs: None
+    stub_transformers.CLIPProcessor = type("CLIPProcessor", (), {})
+    stub_transformers.CLIPModel = type("CLIPModel", (), {})
+
+    class _StubPillowImage:
+        Image = type("Image", (), {})
+
+    stub_pil = types.ModuleType("PIL")
+    stub_pil.Image = _StubPillowImage
+
+    return {
+        "numpy": stub_numpy,
+        "torch": stub_torch,
+        "transformers": stub_transformers,
+        "PIL": stub_pil,
+        "whisper": types.ModuleType("whisper"),
+        "soundfile": types.ModuleType("soundfile"),
+    }
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stubbed_llm_env():
+    """Stub heavy dependencies so importing src does not require optional packages.
+
+    Stubs only fill in modules that are not importable already, and they are
+    removed again after this module's tests, together with any ``src``
+    modules imported against them, so later test modules never see them.
+    """
+
+    before = set(sys.modules)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, module in _build_stub_modules().items():
+            if name not in sys.modules and importlib.util.find_spec(name) is None:
+                monkeypatch.setitem(sys.modules, name, module)
+        yield
+    for name in set(sys.modules) - before:
+        if name == "src" or name.startswith("src."):
+            del sys.modules[name]
+
+
+# Backends are imported inside the fixture, once the stubs are installed.
+_BACKENDS = {
+    "GPT2Backend": ("src.gpt2_generator", {}),
+    "SNNLLMBackend": (
+        "src.llm_snn_backend",
+        {
+            "model_path": "artifacts/missing/student.pt",
+            "metadata_path": "artifacts/missing/metadata.json",
+        },
+    ),
+}
+
+
+@pytest.fixture(scope="module", params=sorted(_BACKENDS))
+def backend(request, _stubbed_llm_env):
+    """Construct each backend once and share it across this module's tests."""
+
+    module_name, kwargs = _BACKENDS[request.param]
+    backend_cls = getattr(importlib.import_module(module_name), request.param)
+
     # Suppress deprecation warnings emitted by GPT2Backend during initialization.
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
-        backend = backend_cls(**kwargs)
+        return backend_cls(**kwargs)
+
 
+def test_llm_backends_generate_returns_text(backend):
     response = backend.generate("Hello", max_tokens=8)
 
     assert isinstance(response, str)
@@ -7,9 +7,14 @@ import sys
 from pathlib import Path
 
 import nacl.signing
+import pytest
 
+from cicd.sign_manifest import main as sign_main
 
-def test_manifest_signature_roundtrip(tmp_path: Path, monkeypatch):
+SEED = hashlib.sha256(b"manifest signature test key").digest()
+
+
+def _write_manifest(tmp_path: Path) -> tuple[Path, bytes]:
     manifest = {
         "models": [
             {"path": "model.bin", "sha256": "aa" * 32, "size": 42},
@@ -21,28 +26,54 @@ def test_manifest_signature_roundtrip(tmp_path: Path, monkeypatch):
     manifest_path = tmp_path / "release_manifest.json"
     manifest_bytes = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8") + b"\n"
     manifest_path.write_bytes(manifest_bytes)
+    return manifest_path, manifest_bytes
+
+
+def _sign_args(manifest_path: Path, signature_path: Path) -> list[str]:
+    return [
+        "--in",
+        str(manifest_path),
+        "--out",
+        str(signature_path),
+        "--key-env",
+        "TEST_SIGNING_KEY",
+    ]
+
+
+def _assert_signature_verifies(signature_path: Path, manifest_bytes: bytes) -> None:
+    signature = signature_path.read_bytes()
+    assert len(signature) == 64
+
+    verify_key = nacl.signing.SigningKey(SEED).verify_key
+    verify_key.verify(manifest_bytes, signature)
 
-    seed = hashlib.sha256(b"manifest signature test key").digest()
-    monkeypatch.setenv("TEST_SIGNING_KEY", seed.hex())
+
+def test_manifest_signature_roundtrip(tmp_path: Path, monkeypatch):
+    manifest_path, manifest_bytes = _write_manifest(tmp_path)
+    monkeypatch.setenv("TEST_SIGNING_KEY", SEED.hex())
+
+    signature_path = tmp_path / "release_manifest.sig"
+    sign_main(_sign_args(manifest_path, signature_path))
+
+    _assert_signature_verifies(signature_path, manifest_bytes)
+
+
+@pytest.mark.slow
+def test_manifest_signature_roundtrip_via_cli(tmp_path: Path, monkeypatch):
+    """Smoke-test the script entry point in its own interpreter."""
+
+    manifest_path, manifest_bytes = _write_manifest(tmp_path)
+    monkeypatch.setenv("TEST_SIGNING_KEY", SEED.hex())
 
     signature_path = tmp_path / "release_manifest.sig"
     subprocess.run(
         [
             sys.executable,
             str(Path("cicd") / "sign_manifest.py"),
-            "--in",
-            str(manifest_path),
-            "--out",
-            str(signature_path),
-            "--key-env",
-            "TEST_SIGNING_KEY",
+            *_sign_args(manifest_path, signature_path),
         ],
         check=True,
         cwd=Path.cwd(),
     )
 
-    signature = signature_path.read_bytes()
-    assert len(signature) == 64
-
-    verify_key = nacl.signing.SigningKey(seed).verify_key
-    verify_key.verify(manifest_bytes, signature)
+    _assert_signature_verifies(signature_path, manifest_bytes)
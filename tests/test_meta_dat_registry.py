@@ -14,13 +14,17 @@ try:
 except ModuleNotFoundError as exc:  # pragma: no cover - import guard
     pytest.skip("drivers.providers.meta not available", allow_module_level=True)
 
+# The registry only stores references, so frame resolution is not part of the
+# contract; small frames keep the tests cheap to allocate and compare.
+FRAME_SHAPE = (64, 64, 3)
+
 
 def test_registry_set_and_get_frame():
     """Registry stores and retrieves camera frames per session."""
     registry = MetaDatRegistry()
     
     session_id = "test-session-1"
-    frame = np.random.randint(0, 255, (720, 960, 3), dtype=np.uint8)
+    frame = np.random.randint(0, 255, FRAME_SHAPE, dtype=np.uint8)
     metadata = {"timestamp_ms": 1234567890, "device_id": "META-001"}
     
     registry.set_frame(session_id, frame, metadata)
@@ -69,8 +73,8 @@ def test_registry_overwrites_previous_frame():
     registry = MetaDatRegistry()
     
     session_id = "test-session-3"
-    frame1 = np.zeros((720, 960, 3), dtype=np.uint8)
-    frame2 = np.ones((720, 960, 3), dtype=np.uint8)
+    frame1 = np.zeros(FRAME_SHAPE, dtype=np.uint8)
+    frame2 = np.ones(FRAME_SHAPE, dtype=np.uint8)
     
     registry.set_frame(session_id, frame1, {"timestamp_ms": 1000})
     registry.set_frame(session_id, frame2, {"timestamp_ms": 2000})
@@ -103,7 +107,7 @@ def test_registry_clear_session():
     registry = MetaDatRegistry()
     
     session_id = "test-session-5"
-    frame = np.random.randint(0, 255, (720, 960, 3), dtype=np.uint8)
+    frame = np.random.randint(0, 255, FRAME_SHAPE, dtype=np.uint8)
     audio = np.random.randn(400).astype(np.float32)
     
     registry.set_frame(session_id, frame, {})
@@ -129,7 +133,7 @@ def test_registry_list_sessions():
     session2 = "session-2"
     session3 = "session-3"
     
-    frame = np.zeros((720, 960, 3), dtype=np.uint8)
+    frame = np.zeros(FRAME_SHAPE, dtype=np.uint8)
     audio = np.zeros(400, dtype=np.float32)
     
     registry.set_frame(session1, frame, {})
@@ -150,7 +154,7 @@ def test_registry_metadata_optional():
     registry = MetaDatRegistry()
     
     session_id = "test-session-6"
-    frame = np.zeros((720, 960, 3), dtype=np.uint8)
+    frame = np.zeros(FRAME_SHAPE, dtype=np.uint8)
     audio = np.zeros(400, dtype=np.float32)
     
     registry.set_frame(session_id, frame, None)
@@ -178,8 +182,10 @@ def test_registry_thread_safety():
     
     def writer_thread(thread_id: int):
         try:
+            # Every write from a thread carries the same pixels, so one
+            # array per thread is enough.
+            frame = np.full(FRAME_SHAPE, thread_id, dtype=np.uint8)
             for i in range(ops_per_thread):
-                frame = np.full((720, 960, 3), thread_id, dtype=np.uint8)
                 metadata = {"thread_id": thread_id, "op": i}
                 registry.set_frame(session_id, frame, metadata)
                 time.sleep(0.001)  # Small delay to encourage interleaving
@@ -220,7 +226,7 @@ def test_registry_thread_safety():
     # Verify final state is valid
     final_frame, final_meta = registry.get_latest_frame(session_id)
     assert final_frame is not None
-    assert final_frame.shape == (720, 960, 3)
+    assert final_frame.shape == FRAME_SHAPE
 
 
 def test_registry_multiple_sessions_isolated():
@@ -230,8 +236,8 @@ def test_registry_multiple_sessions_isolated():
     session1 = "session-a"
     session2 = "session-b"
     
-    frame1 = np.zeros((720, 960, 3), dtype=np.uint8)
-    frame2 = np.ones((720, 960, 3), dtype=np.uint8)
+    frame1 = np.zeros(FRAME_SHAPE, dtype=np.uint8)
+    frame2 = np.ones(FRAME_SHAPE, dtype=np.uint8)
     
     audio1 = np.zeros(400, dtype=np.float32)
     audio2 = np.ones(400, dtype=np.float32)